@@ -1,5 +1,6 @@
 """dune1992-re shared library."""
 from .compression import hsq_decompress, hsq_get_sizes, f7_decompress, f7_compress  # noqa: F401
+from .fileio import read_file  # noqa: F401
 from .constants import (
     SAVE_OFFSETS, SIETCH_COUNT, SIETCH_SIZE, TROOP_COUNT, TROOP_SIZE,
     GAME_STAGES, TROOP_JOBS, EQUIPMENT_FLAGS, equipment_str,
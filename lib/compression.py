@@ -9,6 +9,9 @@ Implements:
 import struct
 
 
+_U16 = struct.Struct('<H')
+
+
 # =============================================================================
 # HSQ DECOMPRESSION (Game resource files: *.HSQ)
 # =============================================================================
@@ -37,6 +40,29 @@ def hsq_decompress(data: bytes) -> bytes:
     Returns:
         Decompressed bytes
 
+    Raises:
+        ValueError: If data is invalid
+    """
+    return bytes(hsq_decompress_into(data, bytearray()))
+
+
+def hsq_decompress_into(data: bytes, out: bytearray) -> memoryview:
+    """
+    Decompress HSQ data into a caller-supplied, reusable buffer.
+
+    Same decoder as hsq_decompress(), but the output is written into `out`
+    (cleared first) so batch callers can keep one bytearray across files
+    instead of allocating a fresh output per file.
+
+    Args:
+        data: Raw HSQ file contents
+        out:  Output buffer; its previous contents are discarded
+
+    Returns:
+        memoryview of the first decompressed-size bytes of `out`. The view
+        must be released (or dropped) before `out` is reused, since a
+        bytearray cannot be resized while a view on it is alive.
+
     Raises:
         ValueError: If data is invalid
     """
@@ -48,68 +74,98 @@ def hsq_decompress(data: bytes) -> bytes:
     comp_size = struct.unpack_from('<H', data, 3)[0]
     # byte 5 is skipped
 
+    # The bit reader and byte fetches are inlined below rather than
+    # written as closures: a nonlocal call per bit dominated the runtime
+    # on the larger resources (GLOBDATA.HSQ, the HERAD music banks).
+    n = len(data)
     pos = 6
     queue = 0  # 16-bit bit queue; 0 means "needs refill"
-    out = bytearray()
+    out.clear()
+    append = out.append
+    extend = out.extend
+    unpack_u16 = _U16.unpack_from
 
-    def read_u8():
-        nonlocal pos
-        if pos >= len(data):
-            raise ValueError(f"HSQ: unexpected end at offset {pos}")
-        val = data[pos]; pos += 1
-        return val
-
-    def read_u16():
-        nonlocal pos
-        if pos + 1 >= len(data):
-            raise ValueError(f"HSQ: unexpected end at offset {pos}")
-        val = struct.unpack_from('<H', data, pos)[0]; pos += 2
-        return val
-
-    def get_bit():
-        nonlocal queue
+    while True:
         bit = queue & 1
         queue >>= 1
         if queue == 0:
-            queue = read_u16()
+            if pos + 1 >= n:
+                raise ValueError(f"HSQ: unexpected end at offset {pos}")
+            queue = unpack_u16(data, pos)[0]; pos += 2
             bit = queue & 1
             queue = 0x8000 | (queue >> 1)
-        return bit
 
-    while True:
-        if get_bit() != 0:
+        if bit:
             # Literal byte
             if len(out) >= decomp_size:
                 break
-            out.append(read_u8())
-        else:
-            if get_bit() != 0:
-                # Long back-reference
-                word = read_u16()
-                count = word & 0x07
-                offset = (word >> 3) - 8192  # signed negative offset
-
-                if count == 0:
-                    count = read_u8()
-                if count == 0:
-                    break  # EOF
-
-                # Copy count+2 bytes from (dst + offset)
-                dst = len(out)
-                for i in range(count + 2):
-                    out.append(out[dst + offset + i])
-            else:
-                # Short back-reference
-                b0 = get_bit()
-                b1 = get_bit()
-                count = 2 * b0 + b1  # 0-3
-                offset = read_u8() - 256  # signed negative offset
+            if pos >= n:
+                raise ValueError(f"HSQ: unexpected end at offset {pos}")
+            append(data[pos]); pos += 1
+            continue
 
-                dst = len(out)
-                for i in range(count + 2):
-                    out.append(out[dst + offset + i])
+        bit = queue & 1
+        queue >>= 1
+        if queue == 0:
+            if pos + 1 >= n:
+                raise ValueError(f"HSQ: unexpected end at offset {pos}")
+            queue = unpack_u16(data, pos)[0]; pos += 2
+            bit = queue & 1
+            queue = 0x8000 | (queue >> 1)
+
+        if bit:
+            # Long back-reference
+            if pos + 1 >= n:
+                raise ValueError(f"HSQ: unexpected end at offset {pos}")
+            word = unpack_u16(data, pos)[0]; pos += 2
+            count = word & 0x07
+            offset = (word >> 3) - 8192  # signed negative offset
+
+            if count == 0:
+                if pos >= n:
+                    raise ValueError(f"HSQ: unexpected end at offset {pos}")
+                count = data[pos]; pos += 1
+            if count == 0:
+                break  # EOF
+        else:
+            # Short back-reference: two more bits of count, then offset byte
+            b0 = queue & 1
+            queue >>= 1
+            if queue == 0:
+                if pos + 1 >= n:
+                    raise ValueError(f"HSQ: unexpected end at offset {pos}")
+                queue = unpack_u16(data, pos)[0]; pos += 2
+                b0 = queue & 1
+                queue = 0x8000 | (queue >> 1)
+            b1 = queue & 1
+            queue >>= 1
+            if queue == 0:
+                if pos + 1 >= n:
+                    raise ValueError(f"HSQ: unexpected end at offset {pos}")
+                queue = unpack_u16(data, pos)[0]; pos += 2
+                b1 = queue & 1
+                queue = 0x8000 | (queue >> 1)
+            count = 2 * b0 + b1  # 0-3
+            if pos >= n:
+                raise ValueError(f"HSQ: unexpected end at offset {pos}")
+            offset = data[pos] - 256; pos += 1  # signed negative offset
+
+        # Copy count+2 bytes from (dst + offset) as one slice. When the
+        # source overlaps the bytes being written (-offset < length) the
+        # copy repeats the last -offset bytes; offset -1 is a byte run.
+        length = count + 2
+        src = len(out) + offset
+        if src < 0:
+            # Corrupt stream reaching before the start of the output: keep
+            # the byte-wise semantics (negative indexes, IndexError)
+            for i in range(src, src + length):
+                append(out[i])
+        elif offset + length <= 0:
+            extend(out[src:src + length])
+        else:
+            extend((out[src:] * (length // -offset + 1))[:length])
 
-    return bytes(out[:decomp_size])
+    return memoryview(out)[:decomp_size]
 
 
 def hsq_get_sizes(data: bytes) -> tuple:
@@ -0,0 +1,9 @@
+"""
+dune1992-re: File I/O helpers shared by the tools.
+"""
+
+
+def read_file(path: str) -> bytes:
+    """Read a whole file and close it."""
+    with open(path, 'rb') as f:
+        return f.read()
@@ -179,8 +179,7 @@ def get_phrase(data: bytes, offsets: list, idx: int) -> str:
         return "<OUT OF RANGE>"
     raw = data[start:min(end, len(data))]
     # Strip trailing 0xFF
-    while raw and raw[-1] == 0xFF:
-        raw = raw[:-1]
+    raw = raw.rstrip(b'\xFF')
     text = ''
     for b in raw:
         if b == 0xFF:
@@ -40,6 +40,8 @@ import struct
 import sys
 import argparse
 import os
+from heapq import nlargest
+from operator import itemgetter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.compression import hsq_decompress
@@ -101,18 +103,17 @@ def decode_record(b0: int, b1: int, b2: int, b3: int) -> dict:
     }
 
 
-def flags_str(rec: dict) -> str:
-    """Format record flags as readable string."""
+def _flags_str(b0: int, menu_flag: int) -> str:
+    """Format byte-0 flags plus the byte-2 menu flag as readable string."""
     parts = []
-    if rec['spoken']:
+    if b0 & 0x80:
         parts.append("SPOKEN")
-    if rec['repeatable']:
+    if b0 & 0x40:
         parts.append("REPEAT")
-    if rec['action_code']:
-        parts.append(f"act={rec['action_code']}")
-    if rec['menu_flag']:
-        parts.append(f"menu={rec['menu_flag']}")
-    b0 = rec['cond_flags']
+    if b0 & 0x0F:
+        parts.append(f"act={b0 & 0x0F}")
+    if menu_flag:
+        parts.append(f"menu={menu_flag}")
     if b0 & 0x20:
         parts.append("0x20")
     if b0 & 0x10:
@@ -120,6 +121,15 @@ def flags_str(rec: dict) -> str:
     return '|'.join(parts) if parts else "none"
 
 
+# Every (byte 0, menu flag) combination, indexed by (b0 << 2) | menu_flag
+_FLAGS_STR = [_flags_str(i >> 2, i & 0x03) for i in range(256 * 4)]
+
+
+def flags_str(rec: dict) -> str:
+    """Format record flags as readable string."""
+    return _FLAGS_STR[(rec['cond_flags'] << 2) | rec['menu_flag']]
+
+
 def cond_type_str(cond_type: int) -> str:
     """Format condition type."""
     if cond_type == 0:
@@ -165,43 +175,57 @@ def load_dialogue(path: str, is_raw: bool = False) -> tuple:
     return bytes(data), entry_count, offsets
 
 
+_RECORD = struct.Struct('4B')
+
+
 def parse_entry(data: bytes, start: int) -> list:
     """
     Parse all 4-byte records in a dialogue entry.
 
+    The FF FF terminator is located with bytes.find (only hits on the
+    4-byte record grid count), then the whole record run is unpacked in
+    one iter_unpack pass.
+
     Returns list of decoded record dicts. Empty list if entry starts with 0xFFFF.
     """
-    records = []
+    end = len(data)
     pos = start
-
-    while pos + 1 < len(data):
-        # Check for FF FF terminator
-        word0 = struct.unpack_from('<H', data, pos)[0]
-        if word0 == 0xFFFF:
+    while True:
+        hit = data.find(b'\xFF\xFF', pos, end)
+        if hit < 0:
             break
-
-        if pos + 3 >= len(data):
+        if (hit - start) % 4 == 0:
+            end = hit
             break
+        pos = hit + 1
 
-        b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
-        records.append(decode_record(b0, b1, b2, b3))
-        pos += 4
+    count = max(0, (end - start) // 4)
+    return [decode_record(b0, b1, b2, b3)
+            for b0, b1, b2, b3 in _RECORD.iter_unpack(data[start:start + count * 4])]
 
-    return records
+
+def parse_all(data: bytes, offsets: list) -> list:
+    """
+    Parse every dialogue entry once.
+
+    Returns list of record lists, indexed like offsets, shared by all
+    display modes.
+    """
+    return [parse_entry(data, start) for start in offsets]
 
 
 # =============================================================================
 # DISPLAY MODES
 # =============================================================================
 
-def show_entry(data: bytes, offsets: list, idx: int):
+def show_entry(data: bytes, offsets: list, entries: list, idx: int):
     """Show detailed view of a single dialogue entry."""
     if idx < 0 or idx >= len(offsets):
         print(f"Entry {idx} out of range (0-{len(offsets) - 1})")
         return
 
     start = offsets[idx]
-    records = parse_entry(data, start)
+    records = entries[idx]
 
     if not records:
         print(f"Entry {idx}: (empty — FF FF terminator)")
@@ -221,11 +245,12 @@ def show_entry(data: bytes, offsets: list, idx: int):
         print(f"  {i:3d}  {raw_hex:12}  {ct:>8}  {ci:>8}  {pi:>6}  {fl}")
 
 
-def show_all(data: bytes, offsets: list):
+def show_all(data: bytes, offsets: list, entries: list):
     """Show compact view of all dialogue entries."""
+    lines = []
     for idx in range(len(offsets)):
         start = offsets[idx]
-        records = parse_entry(data, start)
+        records = entries[idx]
 
         if not records:
             continue
@@ -242,45 +267,51 @@ def show_all(data: bytes, offsets: list):
 
         types_str = ','.join(str(t) for t in cond_types)
 
-        print(f"[{idx:3d}] @0x{start:04X} {len(records):3d} recs  "
-              f"condit={condit_range:<9s}  "
-              f"phrase=0x{first_phrase:03X}-0x{last_phrase:03X}  "
-              f"ctype={types_str}")
+        lines.append(f"[{idx:3d}] @0x{start:04X} {len(records):3d} recs  "
+                     f"condit={condit_range:<9s}  "
+                     f"phrase=0x{first_phrase:03X}-0x{last_phrase:03X}  "
+                     f"ctype={types_str}")
+
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def show_full(data: bytes, offsets: list):
+def show_full(data: bytes, offsets: list, entries: list):
     """Show full decompilation of all entries."""
+    lines = []
     for idx in range(len(offsets)):
         start = offsets[idx]
-        records = parse_entry(data, start)
+        records = entries[idx]
 
         if not records:
             continue
 
-        print(f"\n=== Entry {idx} @ 0x{start:04X} ({len(records)} records) ===")
+        lines.append(f"\n=== Entry {idx} @ 0x{start:04X} ({len(records)} records) ===")
         for i, rec in enumerate(records):
             ct_str = cond_type_str(rec['cond_type'])
             fl_str = flags_str(rec)
-            print(f"  [{i:2d}] CONDIT[{rec['condit_idx']:3d}] ({ct_str}) "
-                  f"→ phrase[0x{rec['phrase_idx']:03X}]"
-                  f"  {fl_str}")
+            lines.append(f"  [{i:2d}] CONDIT[{rec['condit_idx']:3d}] ({ct_str}) "
+                         f"→ phrase[0x{rec['phrase_idx']:03X}]"
+                         f"  {fl_str}")
 
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
-def show_stats(data: bytes, offsets: list):
+
+def show_stats(data: bytes, offsets: list, entries: list):
     """Show dialogue statistics."""
     total_records = 0
     non_empty = 0
-    condit_refs = {}
-    phrase_refs = {}
-    cond_type_usage = {}
+    # Dense counters over the 10/10/2-bit field ranges. Action codes stay in
+    # a dict so equal counts keep their first-seen order in the report.
+    condit_refs = [0] * 1024
+    phrase_refs = [0] * 1024
+    cond_type_usage = [0] * 4
     action_usage = {}
     repeatable_count = 0
     menu_count = 0
 
-    for idx in range(len(offsets)):
-        start = offsets[idx]
-        records = parse_entry(data, start)
-
+    for records in entries:
         if not records:
             continue
 
@@ -288,23 +319,19 @@ def show_stats(data: bytes, offsets: list):
         total_records += len(records)
 
         for rec in records:
-            ci = rec['condit_idx']
-            condit_refs[ci] = condit_refs.get(ci, 0) + 1
-
-            pi = rec['phrase_idx']
-            phrase_refs[pi] = phrase_refs.get(pi, 0) + 1
-
-            ct = rec['cond_type']
-            cond_type_usage[ct] = cond_type_usage.get(ct, 0) + 1
-
+            condit_refs[rec['condit_idx']] += 1
+            phrase_refs[rec['phrase_idx']] += 1
+            cond_type_usage[rec['cond_type']] += 1
             ac = rec['action_code']
             action_usage[ac] = action_usage.get(ac, 0) + 1
-
             if rec['repeatable']:
                 repeatable_count += 1
             if rec['menu_flag']:
                 menu_count += 1
 
+    used_condit = [ci for ci, n in enumerate(condit_refs) if n]
+    used_phrase = [pi for pi, n in enumerate(phrase_refs) if n]
+
     print(f"=== DIALOGUE Statistics ===")
     print(f"  Total entries:       {len(offsets)}")
     print(f"  Non-empty entries:   {non_empty}")
@@ -314,7 +341,7 @@ def show_stats(data: bytes, offsets: list):
     print(f"  Data size:           {len(data):,} bytes")
 
     print(f"\n  Condition type distribution:")
-    for ct in sorted(cond_type_usage):
+    for ct in (ct for ct in range(4) if cond_type_usage[ct]):
         label = "unconditional" if ct == 0 else f"type {ct} (CONDIT[{ct*256}..{ct*256+255}])"
         print(f"    {label}: {cond_type_usage[ct]} records")
 
@@ -327,17 +354,18 @@ def show_stats(data: bytes, offsets: list):
         label = "no action" if ac == 0 else f"action {ac}"
         print(f"    {label}: {action_usage[ac]} records")
 
-    print(f"\n  Unique CONDIT indices: {len(condit_refs)}")
-    print(f"  CONDIT index range: {min(condit_refs)}-{max(condit_refs)}")
+    print(f"\n  Unique CONDIT indices: {len(used_condit)}")
+    print(f"  CONDIT index range: {used_condit[0]}-{used_condit[-1]}")
 
     print(f"\n  Top referenced CONDIT conditions:")
-    for ci, count in sorted(condit_refs.items(), key=lambda x: -x[1])[:15]:
+    for ci, count in nlargest(15, ((ci, condit_refs[ci]) for ci in used_condit),
+                              key=itemgetter(1)):
         ct = ci // 256
         lo = ci % 256
         print(f"    CONDIT[{ci:3d}] (type{ct}:0x{lo:02X}): {count} references")
 
-    print(f"\n  Unique phrase indices: {len(phrase_refs)}")
-    print(f"  Phrase index range: 0x{min(phrase_refs):03X}-0x{max(phrase_refs):03X}")
+    print(f"\n  Unique phrase indices: {len(used_phrase)}")
+    print(f"  Phrase index range: 0x{used_phrase[0]:03X}-0x{used_phrase[-1]:03X}")
 
 
 # =============================================================================
@@ -361,15 +389,16 @@ def main():
 
     data, count, offsets = load_dialogue(args.file, args.raw)
     print(f"  Loaded: {len(data):,} bytes, {count} entries\n")
+    entries = parse_all(data, offsets)
 
     if args.entry is not None:
-        show_entry(data, offsets, args.entry)
+        show_entry(data, offsets, entries, args.entry)
     elif args.full:
-        show_full(data, offsets)
+        show_full(data, offsets, entries)
     elif args.stats:
-        show_stats(data, offsets)
+        show_stats(data, offsets, entries)
     else:
-        show_all(data, offsets)
+        show_all(data, offsets, entries)
 
 
 if __name__ == '__main__':
@@ -15,6 +15,7 @@ import argparse
 import os
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 from compression import hsq_decompress, hsq_get_sizes
@@ -169,44 +170,54 @@ def classify_file(name_no_ext: str, ext: str) -> str:
     return 'unknown'
 
 
+# Per-file work is a stat + open + small read, so it is latency-bound on
+# cold caches and network shares; threads overlap the syscalls (GIL released).
+SCAN_WORKERS = 16
+
+
+def _scan_one(fpath: str):
+    """Classify a single file. Returns a result dict, or None for non-files."""
+    if not os.path.isfile(fpath):
+        return None
+
+    fname = os.path.basename(fpath)
+    name_no_ext, ext = os.path.splitext(fname)
+    ext = ext.upper()
+
+    with open(fpath, 'rb') as f:
+        raw_size = os.fstat(f.fileno()).st_size
+        # Only the 6-byte HSQ header is needed for the size columns
+        header = f.read(6) if ext == '.HSQ' else b''
+
+    # Try HSQ header
+    decomp_size = None
+    if ext == '.HSQ':
+        try:
+            sizes = hsq_get_sizes(header)
+            decomp_size = sizes[0]
+        except Exception:
+            pass
+
+    category = classify_file(name_no_ext, ext)
+    cat_info = CATEGORIES.get(category, {'desc': 'Unclassified', 'tool': None})
+
+    return {
+        'filename': fname,
+        'name': name_no_ext,
+        'ext': ext,
+        'raw_size': raw_size,
+        'decomp_size': decomp_size,
+        'category': category,
+        'description': cat_info['desc'],
+        'tool': cat_info.get('tool'),
+    }
+
+
 def scan_directory(dirpath: str) -> list:
     """Scan game data directory and classify all files."""
-    results = []
-    for fname in sorted(os.listdir(dirpath)):
-        fpath = os.path.join(dirpath, fname)
-        if not os.path.isfile(fpath):
-            continue
-
-        name_no_ext, ext = os.path.splitext(fname)
-        ext = ext.upper()
-
-        raw = open(fpath, 'rb').read()
-        raw_size = len(raw)
-
-        # Try HSQ decompression
-        decomp_size = None
-        if ext == '.HSQ':
-            try:
-                sizes = hsq_get_sizes(raw)
-                decomp_size = sizes[0]
-            except Exception:
-                pass
-
-        category = classify_file(name_no_ext, ext)
-        cat_info = CATEGORIES.get(category, {'desc': 'Unclassified', 'tool': None})
-
-        results.append({
-            'filename': fname,
-            'name': name_no_ext,
-            'ext': ext,
-            'raw_size': raw_size,
-            'decomp_size': decomp_size,
-            'category': category,
-            'description': cat_info['desc'],
-            'tool': cat_info.get('tool'),
-        })
-
-    return results
+    paths = [os.path.join(dirpath, fname) for fname in sorted(os.listdir(dirpath))]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        return [r for r in pool.map(_scan_one, paths) if r is not None]
 
 
 def show_index(results: list, category_filter: str = None):
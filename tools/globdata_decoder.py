@@ -30,6 +30,9 @@ GLOBE_TERRAIN_SIZE = 101    # Terrain/shade data per block (incl. 2-byte padding
 GLOBE_BLOCK_COUNT = 64      # Number of latitude scanline blocks
 GLOBE_PREFIX_SIZE = 422     # Zero padding before first block
 
+# Equator ramp (02, 04, 06, ...): a block is "linear" iff its ramp equals this
+LINEAR_RAMP = bytes((i + 1) * 2 for i in range(GLOBE_RAMP_SIZE))
+
 
 def parse_gradient_tables(data):
     """Parse Part 1: polygon shading gradient tables.
@@ -40,12 +43,16 @@ def parse_gradient_tables(data):
 
     Used by _sub_13BE9_SAL_polygon for shaded polygon fills in SAL scenes.
 
+    Table 'values' are zero-copy memoryview slices of data.
+
     Returns (list of table dicts, end_offset).
     """
     tables = []
+    mv = memoryview(data)
+    n = len(data)
     i = 0
-    while i < len(data):
-        marker = data[i]
+    while i < n:
+        marker = mv[i]
         if marker < 0xBF:
             break
         table_len = 256 - marker
@@ -56,19 +63,18 @@ def parse_gradient_tables(data):
                 'marker': marker,
                 'length': 0,
                 'base_color': 0,
-                'values': [],
+                'values': mv[i:i],
             })
             i += 1
             continue
-        if i + table_len > len(data):
+        if i + table_len > n:
             break
-        values = list(data[i + 1:i + table_len])
         tables.append({
             'offset': i,
             'marker': marker,
-            'length': len(values),
-            'base_color': values[0] if values else 0,
-            'values': values,
+            'length': table_len - 1,
+            'base_color': mv[i + 1],
+            'values': mv[i + 1:i + table_len],
         })
         i += table_len
     return tables, i
@@ -91,42 +97,42 @@ def parse_globe_scanlines(data, globe_start):
     latitudes, the values advance non-linearly due to sphere curvature,
     and the max value decreases (less longitude visible).
 
-    Returns list of scanline dicts.
+    Returns list of scanline dicts. 'ramp' is a memoryview slice and
+    'terrain'/'terrain_raw' are bytes; nothing is expanded to int lists
+    unless a caller indexes or iterates them (only --verbose does).
     """
     scanlines = []
     # First block starts after zero prefix
     first_block = globe_start + GLOBE_PREFIX_SIZE
+    mv = memoryview(data)
+    # Number of whole blocks that fit is known up front; no per-block check
+    n_blocks = min(GLOBE_BLOCK_COUNT, (len(data) - first_block) // GLOBE_BLOCK_SIZE)
 
-    for block_idx in range(GLOBE_BLOCK_COUNT):
+    for block_idx in range(n_blocks):
         block_start = first_block + block_idx * GLOBE_BLOCK_SIZE
-        if block_start + GLOBE_BLOCK_SIZE > len(data):
-            break
+        block = mv[block_start:block_start + GLOBE_BLOCK_SIZE]
 
-        block = data[block_start:block_start + GLOBE_BLOCK_SIZE]
-
-        # Ramp: fixed 98 bytes
-        ramp = list(block[:GLOBE_RAMP_SIZE])
-        ramp_max = max(ramp) if ramp else 0
+        # Ramp: fixed 98 bytes; max and linearity are whole-slice C-level ops
+        ramp_bytes = block[:GLOBE_RAMP_SIZE]
+        ramp_max = max(ramp_bytes)
 
         # Check if ramp is linearly incrementing by 2
-        linear = all(ramp[i] == (i + 1) * 2 for i in range(GLOBE_RAMP_SIZE))
+        linear = ramp_bytes == LINEAR_RAMP
 
         # Terrain: bytes 99-199 (after separator at byte 98)
-        terrain = list(block[GLOBE_RAMP_SIZE + 1:GLOBE_BLOCK_SIZE])
-        # Strip trailing zeros (padding)
-        terrain_trimmed = terrain[:]
-        while terrain_trimmed and terrain_trimmed[-1] == 0:
-            terrain_trimmed.pop()
+        terrain_bytes = block[GLOBE_RAMP_SIZE + 1:GLOBE_BLOCK_SIZE].tobytes()
+        # Strip trailing zeros (padding); trim and distinct count run in C
+        trimmed_bytes = terrain_bytes.rstrip(b'\x00')
 
         scanlines.append({
             'index': block_idx,
             'offset': block_start,
-            'ramp': ramp,
+            'ramp': ramp_bytes,
             'ramp_max': ramp_max,
             'ramp_linear': linear,
-            'terrain': terrain_trimmed,
-            'terrain_raw': terrain,
-            'unique_terrain': len(set(terrain_trimmed)) if terrain_trimmed else 0,
+            'terrain': trimmed_bytes,
+            'terrain_raw': terrain_bytes,
+            'unique_terrain': len(set(trimmed_bytes)),
         })
 
     return scanlines
@@ -134,37 +140,45 @@ def parse_globe_scanlines(data, globe_start):
 
 def show_gradients(tables):
     """Display gradient table analysis."""
+    lines = []
+    out = lines.append
+
     # Filter out empty/terminator tables
     real_tables = [t for t in tables if t['length'] > 0]
 
-    print(f"\n=== Part 1: Polygon Shading Gradient Tables ({len(real_tables)} tables) ===\n")
-    print(f"Used by _sub_13BE9_SAL_polygon for shaded polygon fills in SAL scenes.")
-    print(f"Each table: marker byte (len = 256 - marker) + color index gradient.\n")
-    print(f"{'Table':>5s}  {'Offset':>6s}  {'Marker':>6s}  {'Len':>3s}  {'Base':>4s}  {'Values'}")
-    print(f"{'─'*5:>5s}  {'─'*6:>6s}  {'─'*6:>6s}  {'─'*3:>3s}  {'─'*4:>4s}  {'─'*50}")
+    out(f"\n=== Part 1: Polygon Shading Gradient Tables ({len(real_tables)} tables) ===\n")
+    out(f"Used by _sub_13BE9_SAL_polygon for shaded polygon fills in SAL scenes.")
+    out(f"Each table: marker byte (len = 256 - marker) + color index gradient.\n")
+    out(f"{'Table':>5s}  {'Offset':>6s}  {'Marker':>6s}  {'Len':>3s}  {'Base':>4s}  {'Values'}")
+    out(f"{'─'*5:>5s}  {'─'*6:>6s}  {'─'*6:>6s}  {'─'*3:>3s}  {'─'*4:>4s}  {'─'*50}")
 
     for idx, t in enumerate(real_tables):
         vals = t['values']
-        val_str = ' '.join(f'{v:02X}' for v in vals[:12])
+        val_str = vals[:12].hex(' ').upper()
         if len(vals) > 12:
             val_str += f' ... {vals[-1]:02X}'
-        print(f"{idx:5d}  0x{t['offset']:04X}  0x{t['marker']:02X}    {t['length']:3d}  0x{t['base_color']:02X}  {val_str}")
+        out(f"{idx:5d}  0x{t['offset']:04X}  0x{t['marker']:02X}    {t['length']:3d}  0x{t['base_color']:02X}  {val_str}")
 
-    print(f"\n  Real tables: {len(real_tables)}")
+    out(f"\n  Real tables: {len(real_tables)}")
     if real_tables:
-        print(f"  Table sizes: {min(t['length'] for t in real_tables)}-{max(t['length'] for t in real_tables)} entries")
-        print(f"  Base colors: 0x{min(t['base_color'] for t in real_tables):02X}-0x{max(t['base_color'] for t in real_tables):02X}")
-    print(f"  Terminators: {len(tables) - len(real_tables)} empty 0xFF entries")
+        out(f"  Table sizes: {min(t['length'] for t in real_tables)}-{max(t['length'] for t in real_tables)} entries")
+        out(f"  Base colors: 0x{min(t['base_color'] for t in real_tables):02X}-0x{max(t['base_color'] for t in real_tables):02X}")
+    out(f"  Terminators: {len(tables) - len(real_tables)} empty 0xFF entries")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def show_globe(scanlines, verbose=False):
     """Display globe projection scanline analysis."""
-    print(f"\n=== Part 2: Globe Projection Scanlines ({len(scanlines)} blocks) ===\n")
-    print(f"64 latitude scanlines × 200 bytes. Each block: 98-byte ramp + 101-byte terrain.")
-    print(f"Ramp maps screen x-position → globe longitude. Terrain = shade/type values.\n")
+    lines = []
+    out = lines.append
+
+    out(f"\n=== Part 2: Globe Projection Scanlines ({len(scanlines)} blocks) ===\n")
+    out(f"64 latitude scanlines × 200 bytes. Each block: 98-byte ramp + 101-byte terrain.")
+    out(f"Ramp maps screen x-position → globe longitude. Terrain = shade/type values.\n")
 
-    print(f"{'Line':>4s}  {'Offset':>6s}  {'Max':>5s}  {'Type':>7s}  {'Terrain':>7s}  {'Uniq':>4s}  {'Visual'}")
-    print(f"{'─'*4:>4s}  {'─'*6:>6s}  {'─'*5:>5s}  {'─'*7:>7s}  {'─'*7:>7s}  {'─'*4:>4s}  {'─'*52}")
+    out(f"{'Line':>4s}  {'Offset':>6s}  {'Max':>5s}  {'Type':>7s}  {'Terrain':>7s}  {'Uniq':>4s}  {'Visual'}")
+    out(f"{'─'*4:>4s}  {'─'*6:>6s}  {'─'*5:>5s}  {'─'*7:>7s}  {'─'*7:>7s}  {'─'*4:>4s}  {'─'*52}")
 
     for sl in scanlines:
         # Visual: show ramp coverage proportional to max value
@@ -175,66 +189,73 @@ def show_globe(scanlines, verbose=False):
         ramp_type = 'linear' if sl['ramp_linear'] else 'curved'
         terr_count = len(sl['terrain'])
 
-        print(f"{sl['index']:4d}  0x{sl['offset']:04X}  0x{sl['ramp_max']:02X}  {ramp_type:>7s}  {terr_count:7d}  {sl['unique_terrain']:4d}  |{bar}{pad}|")
+        out(f"{sl['index']:4d}  0x{sl['offset']:04X}  0x{sl['ramp_max']:02X}  {ramp_type:>7s}  {terr_count:7d}  {sl['unique_terrain']:4d}  |{bar}{pad}|")
 
         if verbose:
             # Show ramp values (first 20 + last value)
             ramp = sl['ramp']
-            ramp_str = ' '.join(f'{v:02X}' for v in ramp[:20])
+            ramp_str = ramp[:20].hex(' ').upper()
             if len(ramp) > 20:
                 ramp_str += f' ... {ramp[-1]:02X}'
-            print(f"        ramp: [{ramp_str}]")
+            out(f"        ramp: [{ramp_str}]")
 
             # Show terrain values
             terr = sl['terrain']
             if terr:
-                terr_str = ' '.join(f'{v:02X}' for v in terr[:20])
+                terr_str = terr[:20].hex(' ').upper()
                 if len(terr) > 20:
                     terr_str += f' ... {terr[-1]:02X}'
-                print(f"        terr: [{terr_str}]")
-            print()
+                out(f"        terr: [{terr_str}]")
+            out('')
 
     # Summary
     if scanlines:
         max_vals = [s['ramp_max'] for s in scanlines]
         linear_count = sum(1 for s in scanlines if s['ramp_linear'])
-        print(f"\n  Scanlines: {len(scanlines)} (equator to pole, mirrored for other hemisphere)")
-        print(f"  Ramp max range: 0x{min(max_vals):02X}-0x{max(max_vals):02X} (longitude coverage)")
-        print(f"  Linear ramps: {linear_count}, curved ramps: {len(scanlines) - linear_count}")
+        out(f"\n  Scanlines: {len(scanlines)} (equator to pole, mirrored for other hemisphere)")
+        out(f"  Ramp max range: 0x{min(max_vals):02X}-0x{max(max_vals):02X} (longitude coverage)")
+        out(f"  Linear ramps: {linear_count}, curved ramps: {len(scanlines) - linear_count}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def show_stats(data, tables, globe_start, scanlines):
     """Show overall file statistics."""
+    lines = []
+    out = lines.append
+
     real_tables = [t for t in tables if t['length'] > 0]
     block_start = globe_start + GLOBE_PREFIX_SIZE
 
-    print(f"\n=== GLOBDATA.HSQ Statistics ===\n")
-    print(f"  Total decompressed size: {len(data)} bytes (0x{len(data):04X})")
-    print(f"  Part 1 (gradients):  0x0000-0x{globe_start-1:04X} ({globe_start} bytes)")
-    print(f"  Part 2 (globe):      0x{globe_start:04X}-0x{len(data)-1:04X} ({len(data)-globe_start} bytes)")
+    out(f"\n=== GLOBDATA.HSQ Statistics ===\n")
+    out(f"  Total decompressed size: {len(data)} bytes (0x{len(data):04X})")
+    out(f"  Part 1 (gradients):  0x0000-0x{globe_start-1:04X} ({globe_start} bytes)")
+    out(f"  Part 2 (globe):      0x{globe_start:04X}-0x{len(data)-1:04X} ({len(data)-globe_start} bytes)")
 
-    print(f"\n  --- Part 1: Gradient Tables ---")
-    print(f"  Purpose: SAL polygon shading (_sub_13BE9_SAL_polygon)")
-    print(f"  Format: marker byte (len = 256 - marker) + color index gradient")
-    print(f"  Tables: {len(real_tables)} gradient + {len(tables)-len(real_tables)} terminators")
+    out(f"\n  --- Part 1: Gradient Tables ---")
+    out(f"  Purpose: SAL polygon shading (_sub_13BE9_SAL_polygon)")
+    out(f"  Format: marker byte (len = 256 - marker) + color index gradient")
+    out(f"  Tables: {len(real_tables)} gradient + {len(tables)-len(real_tables)} terminators")
     if real_tables:
-        print(f"  Sizes: {min(t['length'] for t in real_tables)}-{max(t['length'] for t in real_tables)} entries per table")
-        print(f"  Base colors: 0x{min(t['base_color'] for t in real_tables):02X}-0x{max(t['base_color'] for t in real_tables):02X}")
-
-    print(f"\n  --- Part 2: Globe Projection ---")
-    print(f"  Purpose: spinning globe view (sub_1BA75 → gfx_vtable_func_29)")
-    print(f"  Works with: TABLAT.BIN (latitude lookup) + MAP.HSQ (terrain)")
-    print(f"  Zero prefix: {GLOBE_PREFIX_SIZE} bytes (0x{globe_start:04X}-0x{block_start-1:04X})")
-    print(f"  Scanline blocks: {len(scanlines)} × {GLOBE_BLOCK_SIZE} bytes = {len(scanlines)*GLOBE_BLOCK_SIZE} bytes")
-    print(f"  Block structure: {GLOBE_RAMP_SIZE}-byte ramp + 1 sep + {GLOBE_TERRAIN_SIZE}-byte terrain")
+        out(f"  Sizes: {min(t['length'] for t in real_tables)}-{max(t['length'] for t in real_tables)} entries per table")
+        out(f"  Base colors: 0x{min(t['base_color'] for t in real_tables):02X}-0x{max(t['base_color'] for t in real_tables):02X}")
+
+    out(f"\n  --- Part 2: Globe Projection ---")
+    out(f"  Purpose: spinning globe view (sub_1BA75 → gfx_vtable_func_29)")
+    out(f"  Works with: TABLAT.BIN (latitude lookup) + MAP.HSQ (terrain)")
+    out(f"  Zero prefix: {GLOBE_PREFIX_SIZE} bytes (0x{globe_start:04X}-0x{block_start-1:04X})")
+    out(f"  Scanline blocks: {len(scanlines)} × {GLOBE_BLOCK_SIZE} bytes = {len(scanlines)*GLOBE_BLOCK_SIZE} bytes")
+    out(f"  Block structure: {GLOBE_RAMP_SIZE}-byte ramp + 1 sep + {GLOBE_TERRAIN_SIZE}-byte terrain")
     if scanlines:
         max_vals = [s['ramp_max'] for s in scanlines]
-        print(f"  Longitude range: 0x{min(max_vals):02X}-0x{max(max_vals):02X}")
+        out(f"  Longitude range: 0x{min(max_vals):02X}-0x{max(max_vals):02X}")
+
+    out(f"\n  --- Buffer Reuse at Runtime ---")
+    out(f"  RESOURCE_GLOBDATA buffer is also used for:")
+    out(f"  - Map terrain histogram (256 × uint16 LE, counts byte values in MAP.HSQ)")
+    out(f"  - Overwrites loaded GLOBDATA.HSQ content (lines 386-404 in ASM)")
 
-    print(f"\n  --- Buffer Reuse at Runtime ---")
-    print(f"  RESOURCE_GLOBDATA buffer is also used for:")
-    print(f"  - Map terrain histogram (256 × uint16 LE, counts byte values in MAP.HSQ)")
-    print(f"  - Overwrites loaded GLOBDATA.HSQ content (lines 386-404 in ASM)")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
@@ -255,7 +276,7 @@ def main():
 
     # Check if HSQ compressed
     if len(raw) >= 6:
-        checksum = sum(raw[:6]) & 0xFF
+        checksum = (raw[0] + raw[1] + raw[2] + raw[3] + raw[4] + raw[5]) & 0xFF
         if checksum == 0xAB:
             data = hsq_decompress(raw)
             print(f"  Decompressed: {len(raw)} → {len(data)} bytes")
@@ -61,15 +61,24 @@ Usage:
   python herad_decoder.py gamedata/ARRAKIS.HSQ --tracks   # Show track details
   python herad_decoder.py gamedata/ARRAKIS.HSQ --events 0 # Dump events for track 0
   python herad_decoder.py gamedata/ARRAKIS.HSQ --midi DIR # Export to MIDI
+  pypy3 herad_decoder.py gamedata/*.HSQ --stats           # Same, under PyPy
+
+The decoder is stdlib-only and its hot loops (event parsing, HSQ
+decompression) use plain int/bytes operations, so it runs unmodified
+under PyPy, whose tracing JIT speeds up batch runs without any build step.
 """
 
 import argparse
 import os
 import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
-from compression import hsq_decompress
+from compression import hsq_decompress_into
+from fileio import read_file
 
 
 # =============================================================================
@@ -80,6 +89,11 @@ HERAD_DATA_START_OPL2 = 0x0032  # HSQ/M32: track data starts at byte 50
 HERAD_DATA_START_AGD = 0x0052   # AGD: track data starts at byte 82
 HEADER_META_OFFSET = 0x2C       # Metadata at bytes 44-49 (same for all variants)
 
+# Pre-compiled header unpackers
+_U16 = struct.Struct('<H')
+_HEADER_WORDS = struct.Struct('<20H')  # word 0 + up to 19 track offsets
+_HEADER_META = struct.Struct('<3H')    # n_instruments, param2, param3
+
 # Format types
 FMT_OPL2 = 'OPL2'    # HSQ files (AdLib/Sound Blaster)
 FMT_AGD = 'AGD'       # Tandy/PCjr
@@ -89,8 +103,14 @@ FMT_M32 = 'M32'       # Roland MT-32/LAPC-I
 NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
 
+# Precomputed names for every byte value (event data bytes are 0-255)
+_NOTE_NAME_TBL = tuple(f"{NOTE_NAMES[n % 12]}{(n // 12) - 1}" for n in range(256))
+
+
 def note_name(note_num: int) -> str:
     """Convert MIDI note number to name (e.g. 0x37=55 -> G3)."""
+    if 0 <= note_num < 256:
+        return _NOTE_NAME_TBL[note_num]
     octave = (note_num // 12) - 1
     name = NOTE_NAMES[note_num % 12]
     return f"{name}{octave}"
@@ -114,7 +134,7 @@ def detect_format(data: bytes, filepath: str = '') -> str:
 
     # Check header signature for non-extension detection
     if len(data) >= 4:
-        sig = struct.unpack_from('<H', data, 2)[0]
+        sig = _U16.unpack_from(data, 2)[0]
         if sig == HERAD_DATA_START_AGD:
             return FMT_AGD
 
@@ -128,7 +148,7 @@ def get_data_start(fmt: str, data: bytes) -> int:
     which is 0x0052 for most files but 0x0032 for CRYOMUS.AGD.
     """
     if fmt == FMT_AGD:
-        sig = struct.unpack_from('<H', data, 2)[0]
+        sig = _U16.unpack_from(data, 2)[0]
         return sig  # 0x0052 or 0x0032
     return HERAD_DATA_START_OPL2
 
@@ -137,7 +157,7 @@ def is_herad_file(data: bytes, filepath: str = '') -> bool:
     """Check if data is a valid HERAD file."""
     if len(data) < HERAD_DATA_START_OPL2:
         return False
-    sig = struct.unpack_from('<H', data, 2)[0]
+    sig = _U16.unpack_from(data, 2)[0]
     ext = os.path.splitext(filepath)[1].upper() if filepath else ''
     # Accept both 0x0032 and 0x0052 as valid signatures
     if sig == HERAD_DATA_START_OPL2 or sig == HERAD_DATA_START_AGD:
@@ -149,38 +169,39 @@ def is_herad_file(data: bytes, filepath: str = '') -> bool:
 
 
 def parse_herad(data: bytes, filepath: str = '') -> dict:
-    """Parse HERAD file structure from decompressed data."""
+    """Parse HERAD file structure from decompressed data.
+
+    Each entry of 'tracks' carries its bytes as 'data', a memoryview slice
+    of `data` (no per-track copy).
+    """
     fmt = detect_format(data, filepath)
     data_start = get_data_start(fmt, data)
 
     if len(data) < data_start:
         raise ValueError(f"File too small ({len(data)} bytes, need {data_start})")
 
-    # Word 0: instrument block offset
-    inst_offset = struct.unpack_from('<H', data, 0)[0]
+    # Word 0: instrument block offset; words 1+: track offsets
+    # (data_start >= 0x32, so all 20 header words are in range)
+    words = _HEADER_WORDS.unpack_from(data, 0)
+    inst_offset = words[0]
 
-    # Words 1+: track offsets
     track_offsets = []
     max_tracks = 20 if fmt == FMT_AGD else 11
-    for i in range(1, max_tracks):
-        if i * 2 + 1 >= min(len(data), HEADER_META_OFFSET):
-            break
-        off = struct.unpack_from('<H', data, i * 2)[0]
+    for off in words[1:max_tracks]:
         if off == 0:
             break
         track_offsets.append(off)
 
     # Metadata at 0x2C (same position for all variants)
-    n_instruments = struct.unpack_from('<H', data, HEADER_META_OFFSET)[0]
-    meta_param2 = struct.unpack_from('<H', data, HEADER_META_OFFSET + 2)[0]
-    meta_param3 = struct.unpack_from('<H', data, HEADER_META_OFFSET + 4)[0]
+    n_instruments, meta_param2, meta_param3 = _HEADER_META.unpack_from(data, HEADER_META_OFFSET)
 
     # AGD extra params
     agd_params = None
     if fmt == FMT_AGD and data_start == HERAD_DATA_START_AGD:
         agd_params = data[HERAD_DATA_START_OPL2:HERAD_DATA_START_AGD]
 
-    # Compute track sizes
+    # Compute track sizes; track data is a zero-copy view into `data`
+    mv = memoryview(data)
     tracks = []
     for ti in range(len(track_offsets)):
         start = track_offsets[ti]
@@ -193,7 +214,7 @@ def parse_herad(data: bytes, filepath: str = '') -> dict:
                 'index': ti,
                 'offset': start,
                 'size': end - start,
-                'data': data[start:end],
+                'data': mv[start:end],
             })
 
     # Instrument data
@@ -230,8 +251,12 @@ def read_vlq(data: bytes, pos: int) -> tuple:
 
 
 def is_status_byte_opl2(b: int) -> bool:
-    """Check if byte is an OPL2 HERAD status byte (HSQ/AGD format)."""
-    return b in (0x80, 0x90, 0xC0, 0xD0, 0xFF)
+    """Check if byte is an OPL2 HERAD status byte (HSQ/AGD format).
+
+    Status bytes are 0x80, 0x90, 0xC0, 0xD0 and 0xFF; the test is one
+    index into the _OPL2_STATUS table shared with the event decoder.
+    """
+    return _OPL2_STATUS[b] != 0
 
 
 def is_status_byte_m32(b: int) -> bool:
@@ -239,126 +264,415 @@ def is_status_byte_m32(b: int) -> bool:
     return b >= 0x80
 
 
-def parse_track_events(track_data: bytes, fmt: str = FMT_OPL2) -> list:
-    """Parse MIDI-like events from track data.
+# Event dispatch tables: (event_type, message length incl. status byte).
+# M32 is indexed by status >> 4 (channel in low nibble, appended to data);
+# OPL2/AGD is indexed by the exact status byte.
+_M32_EVENTS = [None] * 16
+_M32_EVENTS[0x8] = ('NOTE_OFF', 3)
+_M32_EVENTS[0x9] = ('NOTE_ON', 3)
+_M32_EVENTS[0xB] = ('CONTROL', 3)
+_M32_EVENTS[0xC] = ('PROG_CHG', 2)
+_M32_EVENTS[0xD] = ('AFTERTOUCH', 2)
+_M32_EVENTS[0xE] = ('PITCH_BEND', 3)
+
+_OPL2_EVENTS = [None] * 256
+_OPL2_EVENTS[0x90] = ('NOTE_ON', 3)
+_OPL2_EVENTS[0x80] = ('NOTE_OFF', 3)
+_OPL2_EVENTS[0xC0] = ('PROG_CHG', 2)
+_OPL2_EVENTS[0xD0] = ('CONTROL', 3)
+
+# Status-byte lookup tables (256 entries, 0 = not a status byte), used by
+# the event loop and is_status_byte_opl2(). OPL2 entries hold the message
+# length; 0xFF is a 1-byte voice marker.
+_OPL2_STATUS = bytes(e[1] if e else 0 for e in _OPL2_EVENTS[:0xFF]) + b'\x01'
+_M32_STATUS = bytes(0x80) + b'\x01' * 0x80
+
+
+# Payload width per event type (bytes after the status byte); M32 events
+# from the dispatch table also carry the channel as a trailing element.
+_EVENT_ARGC = {
+    'NOTE_ON': 2, 'NOTE_OFF': 2, 'CONTROL': 2, 'PITCH_BEND': 2,
+    'PROG_CHG': 1, 'AFTERTOUCH': 1, 'VOICE': 1, 'UNKNOWN': 1,
+}
 
-    For OPL2/AGD: uses fixed status bytes (0x80, 0x90, 0xC0, 0xD0).
-    For M32: uses standard MIDI channelized status bytes (0x8N-0xFN).
 
-    Returns list of (delta_time, event_type, event_data) tuples.
-    event_data includes channel for M32 format.
-    """
-    events = []
+def _decode_events_opl2(track_data: bytes) -> tuple:
+    """Event decode kernel for OPL2/AGD tracks (see _decode_events)."""
+    deltas = []
+    etypes = []
+    d1 = bytearray()
+    d2 = bytearray()
+    add_delta = deltas.append
+    add_etype = etypes.append
+    add_d1 = d1.append
+    add_d2 = d2.append
+    is_status = _OPL2_STATUS
+    events = _OPL2_EVENTS
+    n = len(track_data)
     pos = 0
-    is_status = is_status_byte_m32 if fmt == FMT_M32 else is_status_byte_opl2
 
-    while pos < len(track_data):
+    while pos < n:
         b = track_data[pos]
 
-        if is_status(b):
+        if is_status[b]:
             delta = 0
             status = b
+        elif b < 0x80:
+            # Single-byte delta (by far the most common case)
+            delta = b
+            pos += 1
+            if pos >= n:
+                break
+            status = track_data[pos]
         else:
-            delta, pos = read_vlq(track_data, pos)
-            if pos >= len(track_data):
+            # Inline read_vlq
+            delta = 0
+            while pos < n:
+                b = track_data[pos]
+                pos += 1
+                delta = (delta << 7) | (b & 0x7F)
+                if not (b & 0x80):
+                    break
+            if pos >= n:
                 break
             status = track_data[pos]
 
-        if fmt == FMT_M32:
-            # Standard MIDI: channel embedded in status byte
-            msg_type = status & 0xF0
-            channel = status & 0x0F
+        # Fixed status bytes; anything else is a voice byte
+        entry = events[status]
+        if entry is not None:
+            etype, size = entry
+            if pos + size > n:
+                break
+            add_delta(delta)
+            add_etype(etype)
+            add_d1(track_data[pos + 1])
+            add_d2(track_data[pos + 2] if size == 3 else 0)
+            pos += size
+        else:
+            add_delta(delta)
+            add_etype('VOICE')
+            add_d1(status)
+            add_d2(0)
+            pos += 1
+
+    return deltas, etypes, d1, d2, bytearray(len(deltas))
+
+
+def _decode_events_m32(track_data: bytes) -> tuple:
+    """Event decode kernel for M32 tracks (see _decode_events)."""
+    deltas = []
+    etypes = []
+    d1 = bytearray()
+    d2 = bytearray()
+    chans = bytearray()
+    add_delta = deltas.append
+    add_etype = etypes.append
+    add_d1 = d1.append
+    add_d2 = d2.append
+    add_chan = chans.append
+    events = _M32_EVENTS
+    n = len(track_data)
+    pos = 0
 
-            if msg_type == 0x90:
-                if pos + 2 >= len(track_data):
-                    break
-                note = track_data[pos + 1]
-                vel = track_data[pos + 2]
-                events.append((delta, 'NOTE_ON', [note, vel, channel]))
-                pos += 3
-            elif msg_type == 0x80:
-                if pos + 2 >= len(track_data):
-                    break
-                note = track_data[pos + 1]
-                vel = track_data[pos + 2]
-                events.append((delta, 'NOTE_OFF', [note, vel, channel]))
-                pos += 3
-            elif msg_type == 0xC0:
-                if pos + 1 >= len(track_data):
-                    break
-                prog = track_data[pos + 1]
-                events.append((delta, 'PROG_CHG', [prog, channel]))
-                pos += 2
-            elif msg_type == 0xB0:
-                if pos + 2 >= len(track_data):
-                    break
-                cc = track_data[pos + 1]
-                val = track_data[pos + 2]
-                events.append((delta, 'CONTROL', [cc, val, channel]))
-                pos += 3
-            elif msg_type == 0xE0:
-                if pos + 2 >= len(track_data):
+    while pos < n:
+        b = track_data[pos]
+
+        if b >= 0x80:
+            delta = 0
+            status = b
+        else:
+            # Single-byte delta (by far the most common case)
+            delta = b
+            pos += 1
+            if pos >= n:
+                break
+            status = track_data[pos]
+
+        # Standard MIDI: channel embedded in status byte
+        entry = events[status >> 4]
+        if entry is not None:
+            etype, size = entry
+            if pos + size > n:
+                break
+            add_delta(delta)
+            add_etype(etype)
+            add_d1(track_data[pos + 1])
+            add_d2(track_data[pos + 2] if size == 3 else 0)
+            add_chan(status & 0x0F)
+            pos += size
+        elif status >= 0xF0 and status != 0xFF:
+            # SysEx or system message — skip to end marker 0xF7
+            pos += 1
+            while pos < n and track_data[pos] != 0xF7:
+                pos += 1
+            if pos < n:
+                pos += 1  # skip 0xF7
+        else:
+            add_delta(delta)
+            add_etype('VOICE' if status == 0xFF else 'UNKNOWN')
+            add_d1(status)
+            add_d2(0)
+            add_chan(0)
+            pos += 1
+
+    return deltas, etypes, d1, d2, chans
+
+
+# Format-specialised decode kernels: the format test happens once per
+# track instead of once per event. AGD shares the OPL2 event stream.
+_DECODERS = {
+    FMT_OPL2: _decode_events_opl2,
+    FMT_AGD: _decode_events_opl2,
+    FMT_M32: _decode_events_m32,
+}
+
+
+def _decode_events(track_data: bytes, fmt: str) -> tuple:
+    """Event decode kernel: fill parallel columns, one entry per event.
+
+    Returns (deltas, etypes, d1, d2, chans):
+      deltas: list of int delta times
+      etypes: list of event type strings (shared constants, so list.count
+              and identity comparisons are cheap)
+      d1, d2: bytearray of first/second payload byte (0 when absent;
+              d1 is the status byte itself for VOICE/UNKNOWN)
+      chans:  bytearray of MIDI channels (M32; 0 for OPL2/AGD)
+
+    Dispatches to the per-format kernel in _DECODERS (unknown formats use
+    the OPL2 stream). Columns are appended to directly, with no per-event
+    tuple or payload object; the VLQ delta decode is inlined and the
+    status test is a single lookup. read_vlq/is_status_byte_* remain the
+    reference definitions.
+    """
+    return _DECODERS.get(fmt, _decode_events_opl2)(track_data)
+
+
+def track_stats(track_data: bytes, fmt: str = FMT_OPL2) -> tuple:
+    """Count-only scan of a track: (n_note_on, total_ticks, n_events).
+
+    Walks the same state machine as _decode_events() but keeps three
+    scalar counters instead of filling event columns, for callers such as
+    --stats that never look at individual events.
+    """
+    n_note_on = 0
+    total_ticks = 0
+    n_events = 0
+    n = len(track_data)
+    pos = 0
+    is_m32 = fmt == FMT_M32
+    is_status = _M32_STATUS if is_m32 else _OPL2_STATUS
+
+    while pos < n:
+        b = track_data[pos]
+
+        if is_status[b]:
+            delta = 0
+            status = b
+        elif b < 0x80:
+            delta = b
+            pos += 1
+            if pos >= n:
+                break
+            status = track_data[pos]
+        else:
+            delta = 0
+            while pos < n:
+                b = track_data[pos]
+                pos += 1
+                delta = (delta << 7) | (b & 0x7F)
+                if not (b & 0x80):
                     break
-                lsb = track_data[pos + 1]
-                msb = track_data[pos + 2]
-                events.append((delta, 'PITCH_BEND', [lsb, msb, channel]))
-                pos += 3
-            elif msg_type == 0xD0:
-                if pos + 1 >= len(track_data):
+            if pos >= n:
+                break
+            status = track_data[pos]
+
+        if is_m32:
+            entry = _M32_EVENTS[status >> 4]
+            if entry is not None:
+                size = entry[1]
+                if pos + size > n:
                     break
-                pressure = track_data[pos + 1]
-                events.append((delta, 'AFTERTOUCH', [pressure, channel]))
-                pos += 2
-            elif status == 0xFF:
-                events.append((delta, 'VOICE', [status]))
+                if status >> 4 == 0x9:
+                    n_note_on += 1
+                pos += size
+            elif status >= 0xF0 and status != 0xFF:
+                # SysEx: skipped, not counted as an event
                 pos += 1
-            elif msg_type == 0xF0:
-                # SysEx or system message — skip to end marker 0xF7
-                pos += 1
-                while pos < len(track_data) and track_data[pos] != 0xF7:
+                while pos < n and track_data[pos] != 0xF7:
+                    pos += 1
+                if pos < n:
                     pos += 1
-                if pos < len(track_data):
-                    pos += 1  # skip 0xF7
+                continue
             else:
-                events.append((delta, 'UNKNOWN', [status]))
                 pos += 1
         else:
-            # OPL2/AGD: fixed status bytes
-            if status == 0x90:
-                if pos + 2 >= len(track_data):
-                    break
-                note = track_data[pos + 1]
-                vel = track_data[pos + 2]
-                events.append((delta, 'NOTE_ON', [note, vel]))
-                pos += 3
-            elif status == 0x80:
-                if pos + 2 >= len(track_data):
+            size = _OPL2_STATUS[status]
+            if size > 1:
+                if pos + size > n:
                     break
-                note = track_data[pos + 1]
-                vel = track_data[pos + 2]
-                events.append((delta, 'NOTE_OFF', [note, vel]))
-                pos += 3
-            elif status == 0xC0:
-                if pos + 1 >= len(track_data):
-                    break
-                prog = track_data[pos + 1]
-                events.append((delta, 'PROG_CHG', [prog]))
-                pos += 2
-            elif status == 0xD0:
-                if pos + 2 >= len(track_data):
-                    break
-                param = track_data[pos + 1]
-                value = track_data[pos + 2]
-                events.append((delta, 'CONTROL', [param, value]))
-                pos += 3
-            elif status == 0xFF:
-                events.append((delta, 'VOICE', [status]))
-                pos += 1
+                if status == 0x90:
+                    n_note_on += 1
+                pos += size
             else:
-                events.append((delta, 'VOICE', [status]))
                 pos += 1
 
-    return events
+        total_ticks += delta
+        n_events += 1
+
+    return n_note_on, total_ticks, n_events
+
+
+class TrackEvents:
+    """Decoded events of one track, stored as parallel columns.
+
+    Columns (one entry per event, see _decode_events):
+      delta: list of int delta times
+      etype: list of event type strings ('NOTE_ON', 'VOICE', ...)
+      d1, d2: bytearray of payload bytes (0 when absent)
+      chan:  bytearray of MIDI channels (M32 only; 0 for OPL2/AGD)
+
+    Summaries work on whole columns (etype.count('NOTE_ON'), sum(delta))
+    instead of walking per-event tuples. as_tuples() gives the classic
+    (delta, event_type, event_data) view for event dumps and MIDI export.
+    """
+
+    def __init__(self, track_data: bytes, fmt: str = FMT_OPL2):
+        self.fmt = fmt
+        self.delta, self.etype, self.d1, self.d2, self.chan = \
+            _decode_events(track_data, fmt)
+
+    def __len__(self) -> int:
+        return len(self.delta)
+
+    def count(self, etype: str) -> int:
+        """Number of events of the given type."""
+        return self.etype.count(etype)
+
+    def total_ticks(self) -> int:
+        """Sum of all delta times (track duration in ticks)."""
+        return sum(self.delta)
+
+    def channels(self, etypes: frozenset) -> set:
+        """Set of channels used by events whose type is in etypes.
+
+        Selection (compress over a membership map of the etype column)
+        and the set build both run in C, without a per-event Python loop.
+        """
+        return set(compress(self.chan, map(etypes.__contains__, self.etype)))
+
+    def as_tuples(self) -> list:
+        """Return events as (delta_time, event_type, event_data) tuples.
+
+        event_data is a tuple of the payload bytes; it also includes the
+        channel for M32 format.
+        """
+        argc = _EVENT_ARGC
+        events = []
+        append = events.append
+        if self.fmt == FMT_M32:
+            for delta, etype, a, b, ch in zip(self.delta, self.etype, self.d1, self.d2, self.chan):
+                if etype == 'VOICE' or etype == 'UNKNOWN':
+                    append((delta, etype, (a,)))
+                elif argc[etype] == 2:
+                    append((delta, etype, (a, b, ch)))
+                else:
+                    append((delta, etype, (a, ch)))
+        else:
+            for delta, etype, a, b in zip(self.delta, self.etype, self.d1, self.d2):
+                append((delta, etype, (a, b) if argc[etype] == 2 else (a,)))
+        return events
+
+
+def parse_track_events(track_data: bytes, fmt: str = FMT_OPL2) -> TrackEvents:
+    """Parse MIDI-like events from track data.
+
+    For OPL2/AGD: uses fixed status bytes (0x80, 0x90, 0xC0, 0xD0).
+    For M32: uses standard MIDI channelized status bytes (0x8N-0xFN).
+
+    Returns a TrackEvents column set; use .as_tuples() for the list of
+    (delta_time, event_type, event_data) tuples.
+    """
+    return TrackEvents(track_data, fmt)
+
+
+class LazyTrackEvents:
+    """Per-track TrackEvents of one file, each decoded on first access.
+
+    Indexing and iteration behave like a list of TrackEvents, so modes
+    that need a single track (--events N) decode only that one.
+    """
+
+    def __init__(self, tracks: list, fmt: str):
+        self._tracks = tracks
+        self._fmt = fmt
+        self._events = [None] * len(tracks)
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __getitem__(self, idx: int) -> TrackEvents:
+        events = self._events[idx]
+        if events is None:
+            events = self._events[idx] = parse_track_events(
+                self._tracks[idx]['data'], self._fmt)
+        return events
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self._tracks)))
+
+
+# Decompression output buffer shared by every file loaded in this process
+_hsq_buf = bytearray()
+
+
+def _load_data(filepath: str, raw_input: bool = False):
+    """Read a file and HSQ-decompress it unless raw_input.
+
+    Returns the file bytes for raw_input, otherwise a memoryview of the
+    decompressed data in _hsq_buf, or None if decompression failed. The
+    view must be released before the next load reuses the buffer.
+    """
+    raw = read_file(filepath)
+    if raw_input:
+        return raw
+    try:
+        return hsq_decompress_into(raw, _hsq_buf)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _parsed(filepath: str, mtime: float, raw_input: bool = False) -> tuple:
+    """Read, decompress and parse a HERAD file; cached per (path, mtime).
+
+    Returns (data, info, events) where events is a LazyTrackEvents with
+    one TrackEvents per info['tracks'] entry. data is None if HSQ
+    decompression failed; info and events are None if the data is not a
+    HERAD file.
+    """
+    data = _load_data(filepath, raw_input)
+    if data is None:
+        return None, None, None
+    if not raw_input:
+        # The parse is cached, so it gets its own copy of the shared buffer
+        view = data
+        data = view.tobytes()
+        view.release()
+
+    if not is_herad_file(data, filepath):
+        return data, None, None
+
+    info = parse_herad(data, filepath)
+    return data, info, LazyTrackEvents(info['tracks'], info['format'])
+
+
+def load_parsed(filepath: str, raw_input: bool = False) -> tuple:
+    """Load a HERAD file once for all display/export modes.
+
+    See _parsed() for the (data, info, events) result; repeated calls for
+    an unchanged file return the cached parse.
+    """
+    return _parsed(filepath, os.path.getmtime(filepath), raw_input)
 
 
 # =============================================================================
@@ -372,10 +686,13 @@ FORMAT_LABELS = {
 }
 
 
-def show_file(filepath: str, data: bytes):
-    """Analyze a HERAD music file."""
+# M32 event types counted as "using" a channel in the per-track summary
+_CHANNEL_EVENTS = frozenset(('NOTE_ON', 'NOTE_OFF', 'PROG_CHG', 'CONTROL', 'PITCH_BEND'))
+
+
+def show_file(filepath: str, info: dict, events: list):
+    """Analyze a HERAD music file (info/events as from load_parsed)."""
     fname = os.path.basename(filepath)
-    info = parse_herad(data, filepath)
     fmt = info['format']
 
     track_data_size = info['inst_offset'] - info['data_start']
@@ -402,80 +719,90 @@ def show_file(filepath: str, data: bytes):
         print(f"\n  {'Track':>5}  {'Offset':>8}  {'Size':>6}  {'Notes':>5}  {'Events':>6}  {'Duration':>8}")
         print(f"  {'-----':>5}  {'--------':>8}  {'------':>6}  {'-----':>5}  {'------':>6}  {'--------':>8}")
 
-    for track in info['tracks']:
-        events = parse_track_events(track['data'], fmt)
-        note_ons = sum(1 for _, etype, _ in events if etype == 'NOTE_ON')
-        total_ticks = sum(delta for delta, _, _ in events)
+    for track, track_events in zip(info['tracks'], events):
+        note_ons = track_events.count('NOTE_ON')
+        total_ticks = track_events.total_ticks()
         total_notes += note_ons
 
         if fmt == FMT_M32:
             # Count unique channels used
-            channels = set()
-            for _, etype, edata in events:
-                if etype in ('NOTE_ON', 'NOTE_OFF', 'PROG_CHG', 'CONTROL', 'PITCH_BEND') and len(edata) >= 2:
-                    channels.add(edata[-1])
+            channels = track_events.channels(_CHANNEL_EVENTS)
             print(f"  {track['index']:5d}  0x{track['offset']:04X}  {track['size']:6,}  "
-                  f"{note_ons:5d}  {len(channels):5d}  {len(events):6d}  {total_ticks:8,} ticks")
+                  f"{note_ons:5d}  {len(channels):5d}  {len(track_events):6d}  {total_ticks:8,} ticks")
         else:
             print(f"  {track['index']:5d}  0x{track['offset']:04X}  {track['size']:6,}  "
-                  f"{note_ons:5d}  {len(events):6d}  {total_ticks:8,} ticks")
+                  f"{note_ons:5d}  {len(track_events):6d}  {total_ticks:8,} ticks")
 
     print(f"\n  Total notes: {total_notes}")
 
 
-def show_tracks(filepath: str, data: bytes):
-    """Show detailed track information."""
+def show_tracks(filepath: str, info: dict, events: list):
+    """Show detailed track information (info/events as from load_parsed)."""
     fname = os.path.basename(filepath)
-    info = parse_herad(data, filepath)
     fmt = info['format']
 
     print(f"=== {fname} Track Details ({FORMAT_LABELS.get(fmt, fmt)}) ===\n")
 
-    for track in info['tracks']:
-        events = parse_track_events(track['data'], fmt)
-
-        note_ons = [e for _, etype, e in events if etype == 'NOTE_ON']
-        note_offs = [e for _, etype, e in events if etype == 'NOTE_OFF']
-        prog_chgs = [e for _, etype, e in events if etype == 'PROG_CHG']
-        controls = [e for _, etype, e in events if etype == 'CONTROL']
+    for track, track_events in zip(info['tracks'], events):
+        n_notes = track_events.count('NOTE_ON')
+        n_controls = track_events.count('CONTROL')
+
+        # One sweep over the columns collects program changes, the note
+        # range, the note-on velocity range and (M32) the channels used.
+        instruments = []
+        channels = set()
+        lo = vlo = 256
+        hi = vhi = -1
+        for etype, a, b, ch in zip(track_events.etype, track_events.d1,
+                                   track_events.d2, track_events.chan):
+            if etype == 'NOTE_ON':
+                if a < lo:
+                    lo = a
+                if a > hi:
+                    hi = a
+                if b > 0:
+                    if b < vlo:
+                        vlo = b
+                    if b > vhi:
+                        vhi = b
+                channels.add(ch)
+            elif etype == 'NOTE_OFF':
+                if a < lo:
+                    lo = a
+                if a > hi:
+                    hi = a
+                channels.add(ch)
+            elif etype == 'PROG_CHG':
+                instruments.append(a)
 
         # Note range
-        all_notes = [n[0] for n in note_ons] + [n[0] for n in note_offs]
         note_range = ""
-        if all_notes:
-            lo, hi = min(all_notes), max(all_notes)
+        if hi >= 0:
             note_range = f"{note_name(lo)}-{note_name(hi)} ({lo}-{hi})"
 
         # Velocity stats
-        velocities = [n[1] for n in note_ons if n[1] > 0]
         vel_str = ""
-        if velocities:
-            vel_str = f"vel {min(velocities)}-{max(velocities)}"
+        if vhi >= 0:
+            vel_str = f"vel {vlo}-{vhi}"
 
         print(f"Track {track['index']}:")
         print(f"  Offset: 0x{track['offset']:04X}, Size: {track['size']:,} bytes")
-        print(f"  Events: {len(events)} ({len(note_ons)} notes, {len(controls)} controls)")
+        print(f"  Events: {len(track_events)} ({n_notes} notes, {n_controls} controls)")
         if note_range:
             print(f"  Notes:  {note_range} {vel_str}")
-        if prog_chgs:
-            instruments = [p[0] for p in prog_chgs]
+        if instruments:
             print(f"  Instruments: {', '.join(str(i) for i in instruments)}")
 
         # M32: show channels used
         if fmt == FMT_M32:
-            channels = set()
-            for _, etype, edata in events:
-                if etype in ('NOTE_ON', 'NOTE_OFF') and len(edata) >= 3:
-                    channels.add(edata[2])
             if channels:
                 print(f"  Channels: {', '.join(str(c) for c in sorted(channels))}")
         print()
 
 
-def show_events(filepath: str, data: bytes, track_idx: int):
-    """Dump all events for a specific track."""
+def show_events(filepath: str, info: dict, events: list, track_idx: int):
+    """Dump all events for a specific track (info/events as from load_parsed)."""
     fname = os.path.basename(filepath)
-    info = parse_herad(data, filepath)
     fmt = info['format']
 
     if track_idx >= len(info['tracks']):
@@ -484,93 +811,135 @@ def show_events(filepath: str, data: bytes, track_idx: int):
         return
 
     track = info['tracks'][track_idx]
-    events = parse_track_events(track['data'], fmt)
+    track_events = events[track_idx]
 
-    print(f"=== {fname} Track {track_idx} Events ({FORMAT_LABELS.get(fmt, fmt)}) ===")
-    print(f"  Offset: 0x{track['offset']:04X}, Size: {track['size']:,} bytes")
-    print(f"  Events: {len(events)}\n")
+    lines = []
+    out = lines.append
+    out(f"=== {fname} Track {track_idx} Events ({FORMAT_LABELS.get(fmt, fmt)}) ===")
+    out(f"  Offset: 0x{track['offset']:04X}, Size: {track['size']:,} bytes")
+    out(f"  Events: {len(track_events)}\n")
 
-    print(f"  {'#':>4}  {'Delta':>7}  {'Abs':>9}  {'Type':>12}  Details")
-    print(f"  {'----':>4}  {'-------':>7}  {'---------':>9}  {'------------':>12}  -------")
+    out(f"  {'#':>4}  {'Delta':>7}  {'Abs':>9}  {'Type':>12}  Details")
+    out(f"  {'----':>4}  {'-------':>7}  {'---------':>9}  {'------------':>12}  -------")
 
+    # Rows come straight from the event columns (first 1000 only); all
+    # lines are written with a single stdout write at the end.
+    is_m32 = fmt == FMT_M32
+    names = _NOTE_NAME_TBL
     abs_time = 0
-    for i, (delta, etype, edata) in enumerate(events):
+    rows = zip(range(1000), track_events.delta, track_events.etype,
+               track_events.d1, track_events.d2, track_events.chan)
+    for i, delta, etype, a, b, ch in rows:
         abs_time += delta
         detail = ""
-        ch_str = ""
+        ch_str = f" ch={ch}" if is_m32 and etype != 'VOICE' and etype != 'UNKNOWN' else ""
 
-        if fmt == FMT_M32 and len(edata) >= 2 and etype not in ('VOICE', 'UNKNOWN'):
-            ch_str = f" ch={edata[-1]}"
-
-        if etype == 'NOTE_ON':
-            nn = note_name(edata[0])
-            detail = f"note={nn} ({edata[0]})  vel={edata[1]}{ch_str}"
-        elif etype == 'NOTE_OFF':
-            nn = note_name(edata[0])
-            detail = f"note={nn} ({edata[0]})  vel={edata[1]}{ch_str}"
+        if etype == 'NOTE_ON' or etype == 'NOTE_OFF':
+            detail = f"note={names[a]} ({a})  vel={b}{ch_str}"
         elif etype == 'PROG_CHG':
-            detail = f"instrument={edata[0]}{ch_str}"
+            detail = f"instrument={a}{ch_str}"
         elif etype == 'CONTROL':
-            detail = f"cc=0x{edata[0]:02X}  value={edata[1]}{ch_str}"
+            detail = f"cc=0x{a:02X}  value={b}{ch_str}"
         elif etype == 'PITCH_BEND':
-            val = edata[0] | (edata[1] << 7)
-            detail = f"bend={val}{ch_str}"
+            detail = f"bend={a | (b << 7)}{ch_str}"
         elif etype == 'AFTERTOUCH':
-            detail = f"pressure={edata[0]}{ch_str}"
+            detail = f"pressure={a}{ch_str}"
         elif etype == 'VOICE':
-            if edata[0] == 0xFF:
+            if a == 0xFF:
                 detail = "voice=0xFF (sync/default)"
             else:
-                detail = f"voice=0x{edata[0]:02X}"
+                detail = f"voice=0x{a:02X}"
 
-        print(f"  {i:4d}  {delta:7d}  {abs_time:9d}  {etype:>12}  {detail}")
+        out(f"  {i:4d}  {delta:7d}  {abs_time:9d}  {etype:>12}  {detail}")
 
-        if i >= 999:
-            remaining = len(events) - i - 1
-            if remaining > 0:
-                print(f"  ... ({remaining} more events)")
-            break
+    remaining = len(track_events) - 1000
+    if remaining > 0:
+        out(f"  ... ({remaining} more events)")
 
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def show_stats(filepaths: list):
-    """Show summary statistics for multiple HERAD files."""
-    print(f"{'File':<18} {'Format':<6} {'Size':>7}  {'Tracks':>6}  {'Instr':>5}  "
-          f"{'Notes':>6}  {'P2':>4}  {'P3':>3}")
-    print('-' * 72)
 
-    for filepath in filepaths:
-        raw = open(filepath, 'rb').read()
-        try:
-            data = hsq_decompress(raw)
-        except Exception:
-            continue
+# Files handed to each --stats worker task; amortises inter-process overhead
+STATS_CHUNKSIZE = 4
 
-        if not is_herad_file(data, filepath):
-            continue
 
-        fname = os.path.basename(filepath)
-        info = parse_herad(data, filepath)
+def _stats_row(filepath: str):
+    """Decompress and parse one file for --stats.
+
+    Returns a picklable summary tuple (fname, format, file_size, n_tracks,
+    n_instruments, total_notes, param2, param3), or None if the file is
+    not a valid HERAD resource. Runs in a worker process.
+    """
+    view = _load_data(filepath)
+    if view is None:
+        return None
+    try:
+        # Parse straight from the shared buffer; nothing here outlives the
+        # call, so no per-file copy of the decompressed data is made.
+        if not is_herad_file(view, filepath):
+            return None
+
+        # Only note counts are needed: use the count-only scanner rather
+        # than building full event columns for every track.
+        info = parse_herad(view, filepath)
         fmt = info['format']
+        total_notes = sum(track_stats(track['data'], fmt)[0] for track in info['tracks'])
 
-        total_notes = 0
-        for track in info['tracks']:
-            events = parse_track_events(track['data'], fmt)
-            total_notes += sum(1 for _, etype, _ in events if etype == 'NOTE_ON')
+        return (os.path.basename(filepath), info['format'], info['file_size'],
+                info['n_tracks'], info['n_instruments'], total_notes,
+                info['meta_param2'], info['meta_param3'])
+    finally:
+        view.release()
 
+
+def show_stats(filepaths: list):
+    """Show summary statistics for multiple HERAD files.
+
+    Files are independent, so with more than one input the decompress and
+    scan work is spread over a ProcessPoolExecutor (in batches of
+    STATS_CHUNKSIZE files per task). Rows are printed in the order the
+    files were given.
+    """
+    if len(filepaths) > 1:
+        with ProcessPoolExecutor() as ex:
+            rows = list(ex.map(_stats_row, filepaths, chunksize=STATS_CHUNKSIZE))
+    else:
+        rows = [_stats_row(fp) for fp in filepaths]
+
+    print(f"{'File':<18} {'Format':<6} {'Size':>7}  {'Tracks':>6}  {'Instr':>5}  "
+          f"{'Notes':>6}  {'P2':>4}  {'P3':>3}")
+    print('-' * 72)
+
+    for row in rows:
+        if row is None:
+            continue
+        fname, fmt, file_size, n_tracks, n_instr, total_notes, param2, param3 = row
         fmt_short = {'OPL2': 'OPL2', 'AGD': 'AGD', 'M32': 'M32'}.get(fmt, fmt)
-        print(f"{fname:<18} {fmt_short:<6} {info['file_size']:>7,}  {info['n_tracks']:>6}  "
-              f"{info['n_instruments']:>5}  {total_notes:>6}  "
-              f"{info['meta_param2']:>4}  {info['meta_param3']:>3}")
+        print(f"{fname:<18} {fmt_short:<6} {file_size:>7,}  {n_tracks:>6}  "
+              f"{n_instr:>5}  {total_notes:>6}  "
+              f"{param2:>4}  {param3:>3}")
 
 
 # =============================================================================
 # MIDI EXPORT
 # =============================================================================
 
+# Data-byte clamps for MIDI export: min(v, 127), and the same for note-on
+# velocity with 0 mapped to the default 64.
+_CLAMP7 = bytes(min(v, 127) for v in range(256))
+_VELOCITY7 = bytes([64]) + _CLAMP7[1:]
+
+
+# Pre-encoded VLQs for 0..16383 (one or two bytes), which covers the delta
+# times found in the game tracks; larger values use the loop below.
+_VLQ = [bytes((v,)) if v < 0x80 else bytes((0x80 | (v >> 7), v & 0x7F))
+        for v in range(0x4000)]
+
+
 def write_midi_vlq(value: int) -> bytes:
     """Encode a value as MIDI variable-length quantity."""
-    if value < 0:
-        value = 0
+    if value < 0x4000:
+        return _VLQ[max(value, 0)]
     buf = [value & 0x7F]
     value >>= 7
     while value > 0:
@@ -580,13 +949,14 @@ def write_midi_vlq(value: int) -> bytes:
     return bytes(buf)
 
 
-def export_midi(filepath: str, data: bytes, outpath: str, ticks_per_quarter: int = 120):
+def export_midi(filepath: str, info: dict, events: list, outpath: str,
+                ticks_per_quarter: int = 120):
     """Convert HERAD music to Standard MIDI File (format 1).
 
+    info/events are as returned by load_parsed().
     For OPL2/AGD: maps HERAD tracks to MIDI channels 0-8.
     For M32: preserves original channel assignments from the single track.
     """
-    info = parse_herad(data, filepath)
     fmt = info['format']
 
     # MIDI header: format 1, N tracks, ticks per quarter note
@@ -595,65 +965,58 @@ def export_midi(filepath: str, data: bytes, outpath: str, ticks_per_quarter: int
 
     tracks_data = []
 
-    for ti, track in enumerate(info['tracks']):
-        events = parse_track_events(track['data'], fmt)
-
+    for ti, track_events in enumerate(events):
         midi_events = bytearray()
+        emit = midi_events.extend
 
-        for delta, etype, edata in events:
-            vlq = write_midi_vlq(delta)
-
-            if fmt == FMT_M32:
-                # M32: channel is already in edata
-                ch = edata[-1] if len(edata) >= 3 else edata[-1] if len(edata) >= 2 else ti
-
+        # Walk the columns directly; no per-event tuple/payload or bytes([...])
+        # objects. Clamping goes through 256-entry tables instead of min().
+        if fmt == FMT_M32:
+            # M32: channel comes from the status byte (chan column)
+            for delta, etype, a, b, ch in zip(track_events.delta, track_events.etype,
+                                              track_events.d1, track_events.d2,
+                                              track_events.chan):
                 if etype == 'NOTE_ON':
-                    note = min(edata[0], 127)
-                    vel = min(edata[1], 127) if edata[1] > 0 else 64
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0x90 | ch, note, vel]))
+                    emit(write_midi_vlq(delta))
+                    emit((0x90 | ch, _CLAMP7[a], _VELOCITY7[b]))
                 elif etype == 'NOTE_OFF':
-                    note = min(edata[0], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0x80 | ch, note, 64]))
+                    emit(write_midi_vlq(delta))
+                    emit((0x80 | ch, _CLAMP7[a], 64))
                 elif etype == 'PROG_CHG':
-                    prog = min(edata[0], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0xC0 | ch, prog]))
+                    emit(write_midi_vlq(delta))
+                    emit((0xC0 | ch, _CLAMP7[a]))
                 elif etype == 'CONTROL':
-                    cc = min(edata[0], 127)
-                    val = min(edata[1], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0xB0 | ch, cc, val]))
+                    emit(write_midi_vlq(delta))
+                    emit((0xB0 | ch, _CLAMP7[a], _CLAMP7[b]))
                 elif etype == 'PITCH_BEND':
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0xE0 | ch, edata[0] & 0x7F, edata[1] & 0x7F]))
-            else:
-                # OPL2/AGD: assign channel from track index
-                channel = ti if ti < 16 else 15
-
+                    emit(write_midi_vlq(delta))
+                    emit((0xE0 | ch, a & 0x7F, b & 0x7F))
+        else:
+            # OPL2/AGD: assign channel from track index
+            channel = ti if ti < 16 else 15
+            note_on = 0x90 | channel
+            note_off = 0x80 | channel
+            prog_chg = 0xC0 | channel
+            control = 0xB0 | channel
+
+            for delta, etype, a, b in zip(track_events.delta, track_events.etype,
+                                          track_events.d1, track_events.d2):
                 if etype == 'NOTE_ON':
-                    note = min(edata[0], 127)
-                    vel = min(edata[1], 127) if edata[1] > 0 else 64
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0x90 | channel, note, vel]))
+                    emit(write_midi_vlq(delta))
+                    emit((note_on, _CLAMP7[a], _VELOCITY7[b]))
                 elif etype == 'NOTE_OFF':
-                    note = min(edata[0], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0x80 | channel, note, 64]))
+                    emit(write_midi_vlq(delta))
+                    emit((note_off, _CLAMP7[a], 64))
                 elif etype == 'PROG_CHG':
-                    prog = min(edata[0], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0xC0 | channel, prog]))
+                    emit(write_midi_vlq(delta))
+                    emit((prog_chg, _CLAMP7[a]))
                 elif etype == 'CONTROL':
-                    param = min(edata[0], 127)
-                    value = min(edata[1], 127)
-                    midi_events.extend(vlq)
-                    midi_events.extend(bytes([0xB0 | channel, param, value]))
+                    emit(write_midi_vlq(delta))
+                    emit((control, _CLAMP7[a], _CLAMP7[b]))
                 elif etype == 'VOICE':
                     if delta > 0:
-                        midi_events.extend(vlq)
-                        midi_events.extend(bytes([0xB0 | channel, 0x7B, 0]))
+                        emit(write_midi_vlq(delta))
+                        emit((control, 0x7B, 0))
 
         # End of Track meta event
         midi_events.extend(b'\x00\xFF\x2F\x00')
@@ -702,36 +1065,29 @@ def main():
             print(f"File not found: {filepath}", file=sys.stderr)
             continue
 
-        raw = open(filepath, 'rb').read()
-        if args.raw:
-            data = raw
-        else:
-            try:
-                data = hsq_decompress(raw)
-            except Exception:
-                print(f"HSQ decompression failed for {filepath}", file=sys.stderr)
-                continue
+        data, info, events = load_parsed(filepath, args.raw)
+        if data is None:
+            print(f"HSQ decompression failed for {filepath}", file=sys.stderr)
+            continue
 
-        if not is_herad_file(data, filepath):
-            sig = struct.unpack_from('<H', data, 2)[0] if len(data) >= 4 else 0
+        if info is None:
+            sig = _U16.unpack_from(data, 2)[0] if len(data) >= 4 else 0
             print(f"Not a HERAD file: {filepath} (signature=0x{sig:04X})",
                   file=sys.stderr)
             continue
 
-        data = bytes(data)
-
         if args.midi:
             os.makedirs(args.midi, exist_ok=True)
             base = os.path.splitext(os.path.basename(filepath))[0]
             ext = os.path.splitext(filepath)[1].lower().replace('.', '_')
             outpath = os.path.join(args.midi, f"{base}{ext}.mid")
-            export_midi(filepath, data, outpath)
+            export_midi(filepath, info, events, outpath)
         elif args.events is not None:
-            show_events(filepath, data, args.events)
+            show_events(filepath, info, events, args.events)
         elif args.tracks:
-            show_tracks(filepath, data)
+            show_tracks(filepath, info, events)
         else:
-            show_file(filepath, data)
+            show_file(filepath, info, events)
 
         print()
 
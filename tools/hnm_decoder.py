@@ -55,18 +55,30 @@ Usage:
 """
 
 import argparse
+import mmap
 import os
+import re
 import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 from compression import hsq_decompress
+from fileio import read_file
 
 
 # =============================================================================
 # PALETTE PARSING
 # =============================================================================
 
+# Runs of non-zero bytes (palette entries set by a 'pl' update)
+_NONZERO_RUN = re.compile(b'[^\\x00]+')
+
+# 6-bit VGA → 8-bit: val << 2 | val >> 4 (only 0x00-0x3F are valid)
+_VGA_6TO8 = bytes((((v << 2) | (v >> 4)) & 0xFF) for v in range(256))
+
+
 def parse_palette_block(data: bytes, pos: int) -> tuple:
     """
     Parse VGA palette block(s) from HNM data.
@@ -82,7 +94,7 @@ def parse_palette_block(data: bytes, pos: int) -> tuple:
     palette = bytearray(768)  # 256 × 3 RGB
 
     while pos + 1 < len(data):
-        word = struct.unpack_from('<H', data, pos)[0]
+        word = data[pos] | (data[pos + 1] << 8)
         pos += 2
 
         if word == 0xFFFF:
@@ -97,23 +109,37 @@ def parse_palette_block(data: bytes, pos: int) -> tuple:
         if count == 0:
             count = 256
 
-        for i in range(count):
-            if pos + 2 >= len(data):
-                break
-            idx = (start_idx + i) * 3
-            if idx + 2 < len(palette):
-                # 6-bit VGA → 8-bit: val << 2 | val >> 4
-                r = data[pos]
-                g = data[pos + 1]
-                b = data[pos + 2]
-                palette[idx] = (r << 2) | (r >> 4)
-                palette[idx + 1] = (g << 2) | (g >> 4)
-                palette[idx + 2] = (b << 2) | (b >> 4)
-            pos += 3
+        # Whole entries present in the data, and how many land in the palette
+        avail = min(count, (len(data) - pos) // 3)
+        n_set = min(avail, 256 - start_idx)
+        if n_set > 0:
+            rgb = data[pos:pos + n_set * 3]
+            if max(rgb) > 0x3F:
+                raise ValueError('palette component exceeds 6 bits')
+            idx = start_idx * 3
+            palette[idx:idx + n_set * 3] = rgb.translate(_VGA_6TO8)
+        pos += avail * 3
 
     return bytes(palette), pos
 
 
+def merge_palette(palette: bytearray, new_pal: bytes):
+    """
+    Merge a parsed 'pl' update into palette in-place.
+
+    Only entries whose new RGB is not all zero are replaced. The three
+    component planes are ORed into one byte per entry, and each run of
+    non-zero entries is copied as a single slice.
+    """
+    nz = (int.from_bytes(new_pal[0::3], 'little')
+          | int.from_bytes(new_pal[1::3], 'little')
+          | int.from_bytes(new_pal[2::3], 'little')).to_bytes(256, 'little')
+    for m in _NONZERO_RUN.finditer(nz):
+        lo = m.start() * 3
+        hi = m.end() * 3
+        palette[lo:hi] = new_pal[lo:hi]
+
+
 # =============================================================================
 # FRAME DECOMPRESSION
 # =============================================================================
@@ -128,6 +154,12 @@ def decompress_frame_hsq(data: bytes) -> bytes:
     return hsq_decompress(data)
 
 
+# AD codec run lengths indexed by the unary code that follows each repeated
+# codebook byte (number of 1 bits, max 3). 0 selects the nibble-coded long run.
+_AD_RUNS = (2, 3, 4, 0)
+_AD_RUNS_ALT = (0, 2, 3, 4)  # flags & 0x80: long run comes first
+
+
 def decompress_frame_ad(data: bytes) -> tuple:
     """
     Decompress an AD-codec video frame (codebook + RLE).
@@ -139,13 +171,14 @@ def decompress_frame_ad(data: bytes) -> tuple:
       uint8:     salt (checksum byte, sum == 0xAD)
 
     Returns:
-        (pixel_data, x_offset, y_offset)
+        (pixel_data, x_offset, y_offset); pixel_data is the decoder's own
+        framesize-byte bytearray, returned without copying
     """
     if len(data) < 6:
         return b'', 0, 0
 
-    framesize = struct.unpack_from('<H', data, 0)[0]
-    codebooksize = struct.unpack_from('<H', data, 2)[0]
+    framesize = data[0] | (data[1] << 8)
+    codebooksize = data[2] | (data[3] << 8)
     flags = data[4]
 
     pos = 6
@@ -158,21 +191,25 @@ def decompress_frame_ad(data: bytes) -> tuple:
     else:
         x, y = 0, 0
 
-    # Unpack codebook
+    # Unpack codebook. Back-references have bit 7 set in the tag, so the
+    # distance ofs_val + 1 is at least 257 while a copy is at most 9 bytes:
+    # source and destination never overlap and each copy is one slice.
+    # Source bytes before the start of the codebook are skipped (left 0).
     colorbase = 0x80 if (flags & 0x40) else 0
     codebook = bytearray(codebooksize)
     cb_pos = 0
     flip = 0
     o_val = 0
+    n = len(data)
 
     inp_pos = pos
-    while cb_pos < codebooksize and inp_pos < len(data):
+    while cb_pos < codebooksize and inp_pos < n:
         tag = data[inp_pos]
         inp_pos += 1
 
         if tag & 0x80:
             if not flip:
-                if inp_pos >= len(data):
+                if inp_pos >= n:
                     break
                 o_val = data[inp_pos]
                 inp_pos += 1
@@ -182,179 +219,151 @@ def decompress_frame_ad(data: bytes) -> tuple:
             flip ^= 1
 
             ofs_val = (tag << 1) | (length & 1)
-            length = (length >> 1) + 2
-
-            for _ in range(length):
-                if cb_pos >= codebooksize:
-                    break
-                src_idx = cb_pos - ofs_val - 1
-                if 0 <= src_idx < cb_pos:
-                    codebook[cb_pos] = codebook[src_idx]
-                cb_pos += 1
+            length = min((length >> 1) + 2, codebooksize - cb_pos)
+
+            src = cb_pos - ofs_val - 1
+            if src >= 0:
+                codebook[cb_pos:cb_pos + length] = codebook[src:src + length]
+            elif src + length > 0:
+                codebook[cb_pos - src:cb_pos + length] = codebook[:src + length]
+            cb_pos += length
         else:
             if tag:
                 tag = (tag + colorbase) & 0xFF
-            if cb_pos < codebooksize:
-                codebook[cb_pos] = tag
+            codebook[cb_pos] = tag
             cb_pos += 1
 
-    # Decode pixel data using codebook + bit stream
+    # Decode pixel data using codebook + bit stream.
+    #
+    # Each step copies codebook bytes literally while the bit queue yields 0,
+    # then repeats the next codebook byte. The repeat count is a unary code
+    # of up to three 1 bits, mapped through _AD_RUNS / _AD_RUNS_ALT; entry 0
+    # selects the nibble-coded long run. The bit reader is inlined (no
+    # closure call per bit) and runs are written as slice fills.
     output = bytearray(framesize)
     out_pos = 0
     temp_pos = 0
     flip2 = 0
     o_val2 = 0
+    runs = _AD_RUNS_ALT if flags & 0x80 else _AD_RUNS
 
-    # Bit queue for AD codec
+    # Bit queue for AD codec. 0x8000 = empty (refill from the next word).
+    # Once bit 15 is set outside the empty state it stays set forever, so
+    # the queue is left as-is there instead of growing without bound.
     queue = 0x8000
 
-    def get_bit_ad():
-        nonlocal queue, inp_pos
-        if queue == 0x8000:
-            if inp_pos + 1 >= len(data):
-                return 0
-            word = struct.unpack_from('<H', data, inp_pos)[0]
-            inp_pos += 2
-            queue = (word << 1) | 1
-            return (word >> 15) & 1
-        result = (queue >> 15) & 1
-        if queue & 0x8000:
-            queue = (queue << 1) | 0x8000
-        else:
-            queue = (queue << 1) & 0x7FFF
-        return result
-
-    if not (flags & 0x80):
-        # Standard AD mode
-        while out_pos < framesize and temp_pos < codebooksize:
-            while not get_bit_ad():
-                if temp_pos >= codebooksize or out_pos >= framesize:
-                    break
-                output[out_pos] = codebook[temp_pos]
-                out_pos += 1
-                temp_pos += 1
-
-            if temp_pos >= codebooksize or out_pos >= framesize:
-                break
-
-            c = codebook[temp_pos]
-            temp_pos += 1
-
-            if not get_bit_ad():
-                # Repeat 2×
-                for _ in range(2):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-            elif not get_bit_ad():
-                # Repeat 3×
-                for _ in range(3):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-            elif not get_bit_ad():
-                # Repeat 4×
-                for _ in range(4):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-            else:
-                # Long run
-                if out_pos >= framesize:
-                    break
-                if not flip2:
-                    if inp_pos >= len(data):
-                        break
-                    o_val2 = data[inp_pos]
-                    inp_pos += 1
-                    run_len = o_val2 >> 4
+    while out_pos < framesize and temp_pos < codebooksize:
+        # Literal codebook bytes while the queue yields 0 bits
+        limit = min(codebooksize - temp_pos, framesize - out_pos)
+        lit = 0
+        while True:
+            if queue == 0x8000:
+                if inp_pos + 1 >= n:
+                    bit = 0
                 else:
-                    run_len = o_val2 & 0x0F
-                flip2 ^= 1
-
-                if run_len == 0:
-                    if inp_pos >= len(data):
-                        break
-                    run_len = data[inp_pos] + 16
-                    inp_pos += 1
-
-                for _ in range(run_len + 4):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-    else:
-        # Alternate AD mode (flags & 0x80)
-        while out_pos < framesize and temp_pos < codebooksize:
-            while not get_bit_ad():
-                if temp_pos >= codebooksize or out_pos >= framesize:
-                    break
-                output[out_pos] = codebook[temp_pos]
-                out_pos += 1
-                temp_pos += 1
-
-            if temp_pos >= codebooksize or out_pos >= framesize:
+                    word = data[inp_pos] | (data[inp_pos + 1] << 8)
+                    inp_pos += 2
+                    queue = (word << 1) | 1
+                    bit = word >> 15
+            elif queue & 0x8000:
+                bit = 1
+            else:
+                queue = (queue << 1) & 0x7FFF
+                bit = 0
+            if bit or lit >= limit:
                 break
+            lit += 1
+        if lit:
+            output[out_pos:out_pos + lit] = codebook[temp_pos:temp_pos + lit]
+            out_pos += lit
+            temp_pos += lit
+        if lit >= limit:
+            break
 
-            c = codebook[temp_pos]
-            temp_pos += 1
+        c = codebook[temp_pos]
+        temp_pos += 1
 
-            if not get_bit_ad():
-                # Long run first in this mode
-                if not flip2:
-                    if inp_pos >= len(data):
-                        break
-                    o_val2 = data[inp_pos]
-                    inp_pos += 1
-                    run_len = o_val2 >> 4
+        # Unary run code: count up to three 1 bits
+        ones = 0
+        while ones < 3:
+            if queue == 0x8000:
+                if inp_pos + 1 >= n:
+                    bit = 0
                 else:
-                    run_len = o_val2 & 0x0F
-                flip2 ^= 1
+                    word = data[inp_pos] | (data[inp_pos + 1] << 8)
+                    inp_pos += 2
+                    queue = (word << 1) | 1
+                    bit = word >> 15
+            elif queue & 0x8000:
+                bit = 1
+            else:
+                queue = (queue << 1) & 0x7FFF
+                bit = 0
+            if not bit:
+                break
+            ones += 1
 
-                if run_len == 0:
-                    if inp_pos >= len(data):
-                        break
-                    run_len = data[inp_pos] + 16
-                    inp_pos += 1
-
-                for _ in range(run_len + 4):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-            elif not get_bit_ad():
-                # Repeat 2×
-                for _ in range(2):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
-            elif not get_bit_ad():
-                # Repeat 3×
-                for _ in range(3):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
+        run = runs[ones]
+        if not run:
+            # Long run
+            if not flip2:
+                if inp_pos >= n:
+                    break
+                o_val2 = data[inp_pos]
+                inp_pos += 1
+                run_len = o_val2 >> 4
             else:
-                if out_pos >= framesize:
+                run_len = o_val2 & 0x0F
+            flip2 ^= 1
+
+            if run_len == 0:
+                if inp_pos >= n:
                     break
-                # Repeat 4×
-                for _ in range(4):
-                    if out_pos < framesize:
-                        output[out_pos] = c
-                        out_pos += 1
+                run_len = data[inp_pos] + 16
+                inp_pos += 1
+            run = run_len + 4
+
+        end = out_pos + run
+        if end > framesize:
+            end = framesize
+        output[out_pos:end] = bytes((c,)) * (end - out_pos)
+        out_pos = end
 
-    return bytes(output[:framesize]), x, y
+    # output is allocated at exactly framesize: hand it over without a copy
+    return output, x, y
 
 
 def get_frame_checksum(data: bytes) -> int:
     """Calculate 6-byte header checksum for frame compression detection."""
     if len(data) < 6:
         return 0
-    return sum(data[:6]) & 0xFF
+    # Unrolled: no 6-byte slice copy, no generic sum() iteration per frame
+    return (data[0] + data[1] + data[2] + data[3] + data[4] + data[5]) & 0xFF
 
 
 # =============================================================================
 # FRAME RENDERING
 # =============================================================================
 
+# Keep-mask per source pixel: 0xFF where the pixel is 0 (transparent)
+_ZERO_MASK = b'\xFF' + bytes(255)
+
+
+def _blit_transparent(framebuf: bytearray, dst: int, seg: bytes):
+    """
+    Copy seg to framebuf[dst:] leaving pixels where seg is 0 untouched.
+
+    Branchless: the segment, its keep-mask and the old pixels are combined
+    as little-endian big ints, new | (old & mask), so the whole span is
+    composited in a few C-level passes instead of per pixel or per run.
+    """
+    end = dst + len(seg)
+    keep = int.from_bytes(seg.translate(_ZERO_MASK), 'little')
+    old = int.from_bytes(framebuf[dst:end], 'little')
+    framebuf[dst:end] = (int.from_bytes(seg, 'little') | (old & keep)).to_bytes(
+        len(seg), 'little')
+
+
 def render_frame(pixel_data: bytes, framebuf: bytearray,
                  x_off: int, y_off: int, w: int, h: int,
                  flags: int, mode: int, src_offset: int = 0):
@@ -372,128 +381,198 @@ def render_frame(pixel_data: bytes, framebuf: bytearray,
         return
 
     if flags & 0x80:
-        # PackBits compressed rendering
+        # PackBits compressed rendering. Each run/literal is clipped to the
+        # scanline and to the 320x200 buffer once, then written as a slice.
+        transparent = mode == 0xFF
+        n_src = len(pixel_data)
         pos = src_offset
         for y in range(h):
             dst_base = 320 * (y + y_off) + x_off
-            line_remain = w
-            while line_remain > 0 and pos < len(pixel_data):
+            x = 0
+            while x < w and pos < n_src:
                 cmd = pixel_data[pos]
                 pos += 1
                 if cmd & 0x80:
                     # RLE: repeat next byte (257 - cmd) times
-                    count = 257 - cmd
-                    if pos >= len(pixel_data):
+                    if pos >= n_src:
                         break
                     value = pixel_data[pos]
                     pos += 1
-                    for i in range(count):
-                        if line_remain <= 0:
-                            break
-                        dst = dst_base + (w - line_remain)
-                        if mode == 0xFF and value == 0:
-                            pass  # transparent
-                        elif 0 <= dst < 64000:
-                            framebuf[dst] = value
-                        line_remain -= 1
+                    count = min(257 - cmd, w - x)
+                    if value or not transparent:
+                        lo = dst_base + x
+                        hi = lo + count
+                        if lo < 0:
+                            lo = 0
+                        if hi > 64000:
+                            hi = 64000
+                        if lo < hi:
+                            framebuf[lo:hi] = bytes((value,)) * (hi - lo)
+                    x += count
                 else:
                     # Literal: copy (cmd + 1) bytes
-                    count = cmd + 1
-                    for i in range(count):
-                        if line_remain <= 0 or pos >= len(pixel_data):
-                            break
-                        value = pixel_data[pos]
-                        pos += 1
-                        dst = dst_base + (w - line_remain)
-                        if mode == 0xFF and value == 0:
-                            pass  # transparent
-                        elif 0 <= dst < 64000:
-                            framebuf[dst] = value
-                        line_remain -= 1
+                    count = min(cmd + 1, w - x, n_src - pos)
+                    lo = dst_base + x
+                    hi = lo + count
+                    src = pos
+                    if lo < 0:
+                        src -= lo
+                        lo = 0
+                    if hi > 64000:
+                        hi = 64000
+                    if lo < hi:
+                        seg = pixel_data[src:src + hi - lo]
+                        if transparent and 0 in seg:
+                            _blit_transparent(framebuf, lo, seg)
+                        else:
+                            framebuf[lo:hi] = seg
+                    pos += count
+                    x += count
     else:
-        # Uncompressed rendering
+        # Uncompressed rendering: one clipped slice per source row. Rows are
+        # addressed linearly, so x_off + w > 320 spills into the next row.
+        transparent = mode == 0xFF
+        n_src = len(pixel_data)
         pos = src_offset
+        dst_base = 320 * y_off + x_off
+        if w == 320:
+            # Full-width rows are contiguous in source and destination:
+            # blit the whole rectangle as one row
+            w, h = w * h, 1
         for y in range(h):
-            for x in range(w):
-                if pos >= len(pixel_data):
-                    return
-                value = pixel_data[pos]
-                pos += 1
-                dst = 320 * (y + y_off) + (x + x_off)
-                if mode == 0xFF and value == 0:
-                    continue  # transparent
-                if 0 <= dst < 64000:
-                    framebuf[dst] = value
+            if pos >= n_src:
+                return
+            count = min(w, n_src - pos)
+            lo = dst_base
+            hi = lo + count
+            src = pos
+            if lo < 0:
+                src -= lo
+                lo = 0
+            if hi > 64000:
+                hi = 64000
+            if lo < hi:
+                seg = pixel_data[src:src + hi - lo]
+                if transparent and 0 in seg:
+                    _blit_transparent(framebuf, lo, seg)
+                else:
+                    framebuf[lo:hi] = seg
+            pos += count
+            dst_base += 320
 
 
 # =============================================================================
 # BMP EXPORT
 # =============================================================================
 
-def write_bmp(filepath: str, pixels: bytes, palette: bytes,
-              width: int = 320, height: int = 200):
-    """Write 8-bit indexed BMP file."""
+def palette_to_bgra(palette: bytes) -> bytes:
+    """Convert a 768-byte RGB palette to the 1024-byte BMP BGRA table."""
+    rgb = bytes(palette[:768]).ljust(768, b'\x00')
+    bgra = bytearray(1024)
+    bgra[0::4] = rgb[2::3]
+    bgra[1::4] = rgb[1::3]
+    bgra[2::4] = rgb[0::3]
+    return bytes(bgra)
+
+
+# BITMAPFILEHEADER + BITMAPINFOHEADER (14 + 40 bytes)
+_BMP_HEADER = struct.Struct('<2sIHHIIiiHHIIiiII')
+
+
+@lru_cache(maxsize=16)
+def _bmp_header(width: int, height: int, palette: bytes) -> bytes:
+    """BMP file header, DIB header and BGRA palette (54 + 1024 bytes)."""
     row_size = (width + 3) & ~3  # pad to 4-byte boundary
     pixel_data_size = row_size * height
     file_size = 54 + 1024 + pixel_data_size  # header + palette + pixels
 
-    with open(filepath, 'wb') as f:
+    return _BMP_HEADER.pack(
         # BMP file header (14 bytes)
-        f.write(b'BM')
-        f.write(struct.pack('<I', file_size))
-        f.write(struct.pack('<HH', 0, 0))
-        f.write(struct.pack('<I', 54 + 1024))
-
+        b'BM', file_size, 0, 0, 54 + 1024,
         # DIB header (40 bytes)
-        f.write(struct.pack('<I', 40))
-        f.write(struct.pack('<i', width))
-        f.write(struct.pack('<i', -height))  # top-down
-        f.write(struct.pack('<HH', 1, 8))
-        f.write(struct.pack('<I', 0))  # no compression
-        f.write(struct.pack('<I', pixel_data_size))
-        f.write(struct.pack('<ii', 2835, 2835))  # 72 DPI
-        f.write(struct.pack('<II', 256, 0))
-
-        # Palette (256 × BGRA)
-        for i in range(256):
-            r = palette[i * 3] if i * 3 < len(palette) else 0
-            g = palette[i * 3 + 1] if i * 3 + 1 < len(palette) else 0
-            b = palette[i * 3 + 2] if i * 3 + 2 < len(palette) else 0
-            f.write(struct.pack('BBBB', b, g, r, 0))
-
-        # Pixel data (top-down, padded rows)
-        for y in range(height):
-            row_start = y * width
-            row = pixels[row_start:row_start + width]
-            if len(row) < width:
-                row = row + b'\x00' * (width - len(row))
-            if row_size > width:
-                row = row + b'\x00' * (row_size - width)
-            f.write(row)
+        40, width, -height,  # top-down
+        1, 8,  # planes, bits per pixel
+        0,  # no compression
+        pixel_data_size,
+        2835, 2835,  # 72 DPI
+        256, 0,  # colors used, important
+    ) + palette_to_bgra(palette)  # 256 × BGRA
+
+
+def write_bmp(filepath: str, pixels: bytes, palette: bytes,
+              width: int = 320, height: int = 200):
+    """Write 8-bit indexed BMP file.
+
+    pixels and palette may be any buffer-protocol object (bytes, bytearray,
+    memoryview); they are only read, so callers can pass their live decode
+    buffers.
+    """
+    row_size = (width + 3) & ~3  # pad to 4-byte boundary
+    n_pixels = width * height
+    view = memoryview(pixels).cast('B')
+    if len(view) < n_pixels:
+        view = memoryview(bytes(view).ljust(n_pixels, b'\x00'))
+
+    # Headers + palette: cached, since consecutive frames of a movie
+    # almost always share the palette
+    header = _bmp_header(width, height, bytes(palette))
+
+    # Pixel data (top-down, padded rows). 320-wide frames need no row
+    # padding, so the framebuffer goes out as-is through a view; padded
+    # rows are joined straight from views of the source.
+    if row_size > width and height > 0:
+        pad = b'\x00' * (row_size - width)
+        body = pad.join([view[i:i + width]
+                         for i in range(0, n_pixels, width)]) + pad
+    else:
+        body = view[:n_pixels]
+
+    with open(filepath, 'wb', buffering=0) as f:
+        _write_parts(f, header, body)
+
+
+def _write_parts(f, *parts):
+    """Write several buffers to an unbuffered file, in one syscall if possible.
+
+    Uses os.writev() where available, so a header and a body need not be
+    joined into a new buffer. Whatever a short writev() left over (or
+    everything, without writev) is finished with f.write() calls.
+    """
+    done = os.writev(f.fileno(), parts) if hasattr(os, 'writev') else 0
+    for part in parts:
+        view = memoryview(part)
+        if done >= len(view):
+            done -= len(view)
+            continue
+        view = view[done:]
+        done = 0
+        while view:
+            view = view[f.write(view):]
 
 
 # =============================================================================
 # WAV EXPORT
 # =============================================================================
 
+# RIFF + fmt + data chunk headers (44 bytes)
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
 def write_wav(filepath: str, audio_data: bytes, sample_rate: int = 11111):
     """Write 8-bit unsigned PCM WAV file."""
     data_size = len(audio_data)
-    with open(filepath, 'wb') as f:
-        # RIFF header
-        f.write(b'RIFF')
-        f.write(struct.pack('<I', 36 + data_size))
-        f.write(b'WAVE')
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
         # fmt chunk
-        f.write(b'fmt ')
-        f.write(struct.pack('<I', 16))
-        f.write(struct.pack('<HH', 1, 1))  # PCM, mono
-        f.write(struct.pack('<I', sample_rate))
-        f.write(struct.pack('<I', sample_rate))  # byte rate
-        f.write(struct.pack('<HH', 1, 8))  # block align, bits
+        b'fmt ', 16,
+        1, 1,  # PCM, mono
+        sample_rate,
+        sample_rate,  # byte rate
+        1, 8,  # block align, bits
         # data chunk
-        f.write(b'data')
-        f.write(struct.pack('<I', data_size))
+        b'data', data_size)
+    with open(filepath, 'wb') as f:
+        f.write(header)
         f.write(audio_data)
 
 
@@ -501,6 +580,11 @@ def write_wav(filepath: str, audio_data: bytes, sample_rate: int = 11111):
 # HNM FILE PARSER
 # =============================================================================
 
+# Video codec per frame (HnmFile.vid_codec), as reported by get_frame_info()
+CODEC_NONE, CODEC_LZ, CODEC_AD, CODEC_RAW, CODEC_OTHER = range(5)
+_CODEC_NAMES = (None, 'LZ', 'AD', 'raw')
+
+
 class HnmFile:
     """Parser for Dune HNM video files."""
 
@@ -510,7 +594,31 @@ class HnmFile:
         self.frame_offsets = []
         self.header_size = 0
         self.frame_count = 0
-        self.chunks = []
+        # AV chunk table, one column per field
+        self.chunk_offset = []
+        self.chunk_size = []
+        # Sub-chunk index filled by _index_subchunks():
+        #   frame_start/frame_end: per frame, file bounds (end clamped to EOF)
+        #   sd_offset/sd_size: audio payload spans, in file order
+        #   pl_offsets:        per frame, offsets of its 'pl' sub-chunks
+        #   has_sound:         per frame, an 'sd' sub-chunk is present
+        #   video_offset:      per frame, video header offset (-1 = none)
+        #   vid_w/vid_h/vid_flags/vid_mode: per frame, video header fields
+        #   vid_codec:         per frame, CODEC_* value
+        self.frame_start = []
+        self.frame_end = []
+        self.sd_offset = []
+        self.sd_size = []
+        self.pl_offsets = []
+        self.has_sound = []
+        self.video_offset = []
+        self.vid_w = []
+        self.vid_h = []
+        self.vid_flags = []
+        self.vid_mode = []
+        self.vid_codec = []
+        self.readable_frames = 0  # leading frames whose header is in the file
+        self._sound = None  # extract_sound() result, built on first call
         self._parse()
 
     def _parse(self):
@@ -519,7 +627,7 @@ class HnmFile:
             return
 
         # Chunk 0: header
-        self.header_size = struct.unpack_from('<H', self.data, 0)[0]
+        self.header_size = self.data[0] | (self.data[1] << 8)
         if self.header_size > len(self.data):
             return
 
@@ -531,14 +639,13 @@ class HnmFile:
         while pos < self.header_size and self.data[pos] == 0xFF:
             pos += 1
 
-        # Parse frame offset table
+        # Parse frame offset table (one unpack for all uint32 entries)
         table_size = self.header_size - pos
         if table_size >= 4:
             n_entries = table_size // 4
-            for i in range(n_entries):
-                off = struct.unpack_from('<I', self.data, pos)[0]
-                self.frame_offsets.append(off)
-                pos += 4
+            self.frame_offsets = list(
+                struct.unpack_from(f'<{n_entries}I', self.data, pos))
+            pos += n_entries * 4
 
         if len(self.frame_offsets) > 1:
             self.frame_count = len(self.frame_offsets) - 1
@@ -546,100 +653,171 @@ class HnmFile:
             self.frame_count = 0
 
         # Parse AV frame chunks
-        chunk_pos = self.header_size
         for frame_idx in range(self.frame_count):
             expected_pos = self.frame_offsets[frame_idx] + self.header_size
             if expected_pos >= len(self.data):
                 break
 
             av_size = struct.unpack_from('<H', self.data, expected_pos)[0]
-            self.chunks.append({
-                'offset': expected_pos,
-                'size': av_size,
-                'frame_idx': frame_idx,
-            })
+            self.chunk_offset.append(expected_pos)
+            self.chunk_size.append(av_size)
+
+        self._index_subchunks()
+
+    def _index_subchunks(self):
+        """
+        Walk every AV frame's sub-chunk chain once.
+
+        'pl', 'sd' and 'mm' sub-chunks are followed by their uint16 size
+        until the video header (any other tag), a zero size, or the frame
+        end. Audio spans stop at the first frame whose header is past EOF.
+        The video header fields and codec are decoded here as well, so
+        get_frame_info() and decode_frame() only index columns.
+        """
+        data = self.data
+        n = len(data)
+        base = self.header_size
+        offsets = self.frame_offsets[:self.frame_count + 1]
+        # Frame bounds; ends are clamped to EOF so walkers need one compare
+        self.frame_start = [off + base for off in offsets[:-1]]
+        self.frame_end = [min(off + base, n) for off in offsets[1:]]
+
+        self.readable_frames = next(
+            (i for i, start in enumerate(self.frame_start) if start + 2 > n),
+            len(self.frame_start))
+
+        sound = True
+        for frame_start, frame_end in zip(self.frame_start, self.frame_end):
+            pl = []
+            has_sound = False
+            video = -1
+            w = h = flags = mode = 0
+            codec = CODEC_NONE
+
+            if frame_start + 2 > n:
+                sound = False
+            else:
+                pos = frame_start + 2
+                while pos + 4 <= frame_end:
+                    tag = data[pos] | (data[pos + 1] << 8)
+                    if tag not in (0x6C70, 0x6473, 0x6D6D):
+                        # Video frame header
+                        video = pos
+                        b1 = data[pos + 1]
+                        w = ((b1 & 0x01) << 8) | data[pos]
+                        flags = b1 & 0xFE
+                        h = data[pos + 2]
+                        mode = data[pos + 3]
+                        if w > 0 and h > 0:
+                            if not (flags & 0x02):
+                                codec = CODEC_RAW
+                            elif pos + 10 <= n:
+                                checksum = get_frame_checksum(data[pos + 4:pos + 10])
+                                if checksum == 0xAB:
+                                    codec = CODEC_LZ
+                                elif checksum == 0xAD:
+                                    codec = CODEC_AD
+                                else:
+                                    codec = CODEC_OTHER
+                        break
+                    sub_size = data[pos + 2] | (data[pos + 3] << 8)
+                    if tag == 0x6C70:  # 'pl'
+                        pl.append(pos)
+                    elif tag == 0x6473:  # 'sd'
+                        has_sound = True
+                        if sound and sub_size > 4 and pos + sub_size <= n:
+                            self.sd_offset.append(pos + 4)
+                            self.sd_size.append(sub_size - 4)
+                    if sub_size == 0:
+                        break
+                    pos += sub_size
+
+            self.pl_offsets.append(tuple(pl))
+            self.has_sound.append(has_sound)
+            self.video_offset.append(video)
+            self.vid_w.append(w)
+            self.vid_h.append(h)
+            self.vid_flags.append(flags)
+            self.vid_mode.append(mode)
+            self.vid_codec.append(codec)
 
     def get_frame_info(self, frame_idx: int) -> dict:
         """Get detailed info about a specific frame."""
         if frame_idx >= self.frame_count or frame_idx >= len(self.frame_offsets) - 1:
             return {}
 
-        frame_start = self.frame_offsets[frame_idx] + self.header_size
-        frame_end = self.frame_offsets[frame_idx + 1] + self.header_size
-
+        frame_start = self.frame_start[frame_idx]
         if frame_start + 2 > len(self.data):
             return {}
 
-        av_size = struct.unpack_from('<H', self.data, frame_start)[0]
-        pos = frame_start + 2
-
-        info = {
+        return {
             'offset': frame_start,
-            'av_size': av_size,
-            'sound': False,
-            'palette': False,
-            'video': False,
-            'width': 0,
-            'height': 0,
-            'flags': 0,
-            'mode': 0,
-            'codec': None,
+            'av_size': self.data[frame_start] | (self.data[frame_start + 1] << 8),
+            'sound': self.has_sound[frame_idx],
+            'palette': bool(self.pl_offsets[frame_idx]),
+            'video': self.video_offset[frame_idx] >= 0,
+            'width': self.vid_w[frame_idx],
+            'height': self.vid_h[frame_idx],
+            'flags': self.vid_flags[frame_idx],
+            'mode': self.vid_mode[frame_idx],
+            'codec': self._codec_name(frame_idx),
         }
 
-        while pos + 4 <= frame_end and pos + 4 <= len(self.data):
-            tag = struct.unpack_from('<H', self.data, pos)[0]
+    def _codec_name(self, frame_idx: int):
+        """Codec label of a frame: 'LZ', 'AD', 'raw', a hex checksum, or None."""
+        codec = self.vid_codec[frame_idx]
+        if codec == CODEC_OTHER:
+            pos = self.video_offset[frame_idx] + 4
+            return f'0x{get_frame_checksum(self.data[pos:pos + 6]):02X}'
+        return _CODEC_NAMES[codec]
 
-            if tag == 0x6C70:  # 'pl'
-                info['palette'] = True
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                if sub_size == 0:
-                    break
-                pos += sub_size
-            elif tag == 0x6473:  # 'sd'
-                info['sound'] = True
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                if sub_size == 0:
-                    break
-                pos += sub_size
-            elif tag == 0x6D6D:  # 'mm'
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                if sub_size == 0:
-                    break
-                pos += sub_size
-            else:
-                # Video frame header
-                b0 = self.data[pos] if pos < len(self.data) else 0
-                b1 = self.data[pos + 1] if pos + 1 < len(self.data) else 0
-                b2 = self.data[pos + 2] if pos + 2 < len(self.data) else 0
-                b3 = self.data[pos + 3] if pos + 3 < len(self.data) else 0
-
-                w = ((b1 & 0x01) << 8) | b0
-                flags = b1 & 0xFE
-                h = b2
-                mode = b3
-
-                info['video'] = True
-                info['width'] = w
-                info['height'] = h
-                info['flags'] = flags
-                info['mode'] = mode
-
-                # Check codec type
-                data_pos = pos + 4
-                if w > 0 and h > 0 and (flags & 0x02) and data_pos + 6 <= len(self.data):
-                    checksum = get_frame_checksum(self.data[data_pos:data_pos + 6])
-                    if checksum == 0xAB:
-                        info['codec'] = 'LZ'
-                    elif checksum == 0xAD:
-                        info['codec'] = 'AD'
-                    else:
-                        info['codec'] = f'0x{checksum:02X}'
-                elif w > 0 and h > 0 and not (flags & 0x02):
-                    info['codec'] = 'raw'
-
-                break
-
-        return info
+    def frame_summary(self, count: int) -> dict:
+        """
+        Summarize the first count frames from the index columns.
+
+        Returns a dict with:
+          sound_frames:   frames carrying an 'sd' sub-chunk
+          palette_frames: frames carrying a 'pl' sub-chunk
+          resolutions:    set of (width, height) of non-empty video frames
+          modes:          set of their video modes
+          codecs:         codec label -> number of video frames
+        """
+        n = min(count, self.frame_count)
+        # Per-frame flags are counted in C on the column slices
+        sound_frames = self.has_sound[:n].count(True)
+        palette_frames = n - self.pl_offsets[:n].count(())
+
+        # Video fields are only set for frames with a video header, and a
+        # codec only for non-empty ones (w, h > 0), so every other frame
+        # holds zeros. The columns are deduplicated by set() in C first;
+        # only the few distinct (w, h, mode) triples are filtered here.
+        shapes = {t for t in set(zip(self.vid_w[:n], self.vid_h[:n],
+                                     self.vid_mode[:n]))
+                  if t[0] > 0 and t[1] > 0}
+        resolutions = {(w, h) for w, h, _ in shapes}
+        modes = {mode for _, _, mode in shapes}
+
+        # Known codecs are counted on the column; unknown ones are labelled
+        # per frame from the frame's checksum
+        codec_col = self.vid_codec[:n]
+        codecs = {}
+        if CODEC_OTHER in codec_col:
+            for i, codec in enumerate(codec_col):
+                if codec == CODEC_OTHER:
+                    name = self._codec_name(i)
+                    codecs[name] = codecs.get(name, 0) + 1
+        for codec in (CODEC_LZ, CODEC_AD, CODEC_RAW):
+            frames = codec_col.count(codec)
+            if frames:
+                codecs[_CODEC_NAMES[codec]] = frames
+
+        return {
+            'sound_frames': sound_frames,
+            'palette_frames': palette_frames,
+            'resolutions': resolutions,
+            'modes': modes,
+            'codecs': codecs,
+        }
 
     def decode_frame(self, frame_idx: int, framebuf: bytearray,
                      palette: bytearray) -> bool:
@@ -652,146 +830,96 @@ class HnmFile:
         if frame_idx >= self.frame_count or frame_idx >= len(self.frame_offsets) - 1:
             return False
 
-        frame_start = self.frame_offsets[frame_idx] + self.header_size
-        frame_end = self.frame_offsets[frame_idx + 1] + self.header_size
+        # 'pl' — palette updates precede the video header
+        for pl_pos in self.pl_offsets[frame_idx]:
+            new_pal, _ = parse_palette_block(self.data, pl_pos + 4)
+            merge_palette(palette, new_pal)
 
-        if frame_start + 2 > len(self.data):
+        pos = self.video_offset[frame_idx]
+        if pos < 0:
             return False
+        frame_end = self.frame_end[frame_idx]
 
-        pos = frame_start + 2  # skip avFrameSize
-
-        had_video = False
-
-        while pos + 4 <= frame_end and pos + 4 <= len(self.data):
-            tag = struct.unpack_from('<H', self.data, pos)[0]
-
-            if tag == 0x6C70:  # 'pl' — palette update
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                new_pal, _ = parse_palette_block(self.data, pos + 4)
-                # Merge non-zero entries into palette
-                for i in range(256):
-                    r, g, b = new_pal[i*3], new_pal[i*3+1], new_pal[i*3+2]
-                    if r != 0 or g != 0 or b != 0:
-                        palette[i*3] = r
-                        palette[i*3+1] = g
-                        palette[i*3+2] = b
-                if sub_size == 0:
-                    break
-                pos += sub_size
-
-            elif tag == 0x6473:  # 'sd' — sound data (skip)
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                if sub_size == 0:
-                    break
-                pos += sub_size
+        # Video frame
+        w = self.vid_w[frame_idx]
+        h = self.vid_h[frame_idx]
+        flags = self.vid_flags[frame_idx]
+        mode = self.vid_mode[frame_idx]
+        data_pos = pos + 4
 
-            elif tag == 0x6D6D:  # 'mm' — metadata (skip)
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-                if sub_size == 0:
-                    break
-                pos += sub_size
+        if w == 0 or h == 0:
+            return False
 
+        remaining = frame_end - data_pos
+
+        if flags & 0x02:
+            # Compressed frame
+            frame_data = self.data[data_pos:data_pos + remaining]
+            checksum = get_frame_checksum(frame_data)
+
+            if checksum == 0xAB:
+                # HSQ/LZ77
+                try:
+                    decoded = decompress_frame_hsq(frame_data)
+                except Exception:
+                    return False
+            elif checksum == 0xAD:
+                # AD codec
+                try:
+                    decoded, ad_x, ad_y = decompress_frame_ad(frame_data)
+                except Exception:
+                    return False
+                # AD codec handles its own x,y
+                render_frame(decoded, framebuf, ad_x, ad_y, w, h,
+                             flags, mode)
+                return True
             else:
-                # Video frame
-                b0 = self.data[pos]
-                b1 = self.data[pos + 1]
-                b2 = self.data[pos + 2]
-                b3 = self.data[pos + 3]
-
-                w = ((b1 & 0x01) << 8) | b0
-                flags = b1 & 0xFE
-                h = b2
-                mode = b3
-                data_pos = pos + 4
-
-                if w == 0 or h == 0:
-                    break
+                return False
 
-                remaining = frame_end - data_pos
-
-                if flags & 0x02:
-                    # Compressed frame
-                    frame_data = self.data[data_pos:data_pos + remaining]
-                    checksum = get_frame_checksum(frame_data)
-
-                    if checksum == 0xAB:
-                        # HSQ/LZ77
-                        try:
-                            decoded = decompress_frame_hsq(frame_data)
-                        except Exception:
-                            break
-                    elif checksum == 0xAD:
-                        # AD codec
-                        try:
-                            decoded, ad_x, ad_y = decompress_frame_ad(frame_data)
-                        except Exception:
-                            break
-                        # AD codec handles its own x,y
-                        render_frame(decoded, framebuf, ad_x, ad_y, w, h,
-                                     flags, mode)
-                        had_video = True
-                        break
-                    else:
-                        break
+            # Standard HSQ decoded frame
+            if flags & 0x04:
+                # Full frame, no offset
+                render_frame(decoded, framebuf, 0, 0, w, h,
+                             flags, mode)
+            else:
+                # Frame has x,y offset in first 4 bytes
+                if len(decoded) >= 4:
+                    x_off = decoded[0] | (decoded[1] << 8)
+                    y_off = decoded[2] | (decoded[3] << 8)
+                    render_frame(decoded, framebuf, x_off, y_off,
+                                 w, h, flags, mode, src_offset=4)
+        else:
+            # Uncompressed frame
+            raw_data = self.data[data_pos:data_pos + remaining]
 
-                    # Standard HSQ decoded frame
-                    if flags & 0x04:
-                        # Full frame, no offset
-                        render_frame(decoded, framebuf, 0, 0, w, h,
-                                     flags, mode)
-                    else:
-                        # Frame has x,y offset in first 4 bytes
-                        if len(decoded) >= 4:
-                            x_off = struct.unpack_from('<H', decoded, 0)[0]
-                            y_off = struct.unpack_from('<H', decoded, 2)[0]
-                            render_frame(decoded, framebuf, x_off, y_off,
-                                         w, h, flags, mode, src_offset=4)
-                else:
-                    # Uncompressed frame
-                    raw_data = self.data[data_pos:data_pos + remaining]
-
-                    if flags & 0x04:
-                        render_frame(raw_data, framebuf, 0, 0, w, h,
-                                     flags, mode)
-                    else:
-                        if len(raw_data) >= 4:
-                            x_off = struct.unpack_from('<H', raw_data, 0)[0]
-                            y_off = struct.unpack_from('<H', raw_data, 2)[0]
-                            render_frame(raw_data, framebuf, x_off, y_off,
-                                         w, h, flags, mode, src_offset=4)
-
-                had_video = True
-                break
+            if flags & 0x04:
+                render_frame(raw_data, framebuf, 0, 0, w, h,
+                             flags, mode)
+            else:
+                if len(raw_data) >= 4:
+                    x_off = raw_data[0] | (raw_data[1] << 8)
+                    y_off = raw_data[2] | (raw_data[3] << 8)
+                    render_frame(raw_data, framebuf, x_off, y_off,
+                                 w, h, flags, mode, src_offset=4)
 
-        return had_video
+        return True
 
     def extract_sound(self) -> bytes:
-        """Extract all sound data from the HNM file."""
-        audio = bytearray()
-
-        for frame_idx in range(self.frame_count):
-            frame_start = self.frame_offsets[frame_idx] + self.header_size
-            frame_end = self.frame_offsets[frame_idx + 1] + self.header_size
-
-            if frame_start + 2 > len(self.data):
-                break
-
-            pos = frame_start + 2
-
-            while pos + 4 <= frame_end and pos + 4 <= len(self.data):
-                tag = struct.unpack_from('<H', self.data, pos)[0]
-                sub_size = struct.unpack_from('<H', self.data, pos + 2)[0]
-
-                if tag == 0x6473:  # 'sd'
-                    sound_bytes = sub_size - 4
-                    if sound_bytes > 0 and pos + 4 + sound_bytes <= len(self.data):
-                        audio.extend(self.data[pos + 4:pos + 4 + sound_bytes])
+        """Extract all sound data from the HNM file.
 
-                if sub_size == 0 or tag not in (0x6C70, 0x6473, 0x6D6D):
-                    break
-                pos += sub_size
+        The joined audio is built once and cached on the instance.
+        """
+        if self._sound is None:
+            # Gather the indexed 'sd' spans as zero-copy views; join() sizes
+            # the result once and copies each span a single time.
+            mv = memoryview(self.data)
+            self._sound = b''.join([mv[off:off + size]
+                                    for off, size in zip(self.sd_offset, self.sd_size)])
+        return self._sound
 
-        return bytes(audio)
+    def sound_size(self) -> int:
+        """Total audio payload size in bytes, without extracting it."""
+        return sum(self.sd_size)
 
 
 # =============================================================================
@@ -800,7 +928,7 @@ class HnmFile:
 
 def analyze_hnm(filepath: str):
     """Analyze an HNM file and report its structure."""
-    data = open(filepath, 'rb').read()
+    data = read_file(filepath)
     fname = os.path.basename(filepath)
     hnm = HnmFile(data)
 
@@ -808,46 +936,28 @@ def analyze_hnm(filepath: str):
     print(f"  Header size: {hnm.header_size} bytes")
     print(f"  Frame count: {hnm.frame_count}")
 
-    # Analyze frames
-    codecs = {'LZ': 0, 'AD': 0, 'raw': 0}
-    sound_frames = 0
-    palette_frames = 0
-    resolutions = set()
-    modes = set()
+    # Analyze frames (stops at the first frame whose header is past EOF)
+    summary = hnm.frame_summary(min(hnm.readable_frames, 5000))
+    resolutions = sorted(f"{w}x{h}" for w, h in summary['resolutions'])
+    modes = sorted(summary['modes'])
+    codecs = summary['codecs']
 
-    for i in range(min(hnm.frame_count, 5000)):
-        info = hnm.get_frame_info(i)
-        if not info:
-            break
-        if info.get('sound'):
-            sound_frames += 1
-        if info.get('palette'):
-            palette_frames += 1
-        if info.get('video'):
-            w, h = info['width'], info['height']
-            if w > 0 and h > 0:
-                resolutions.add(f"{w}x{h}")
-                modes.add(info['mode'])
-            codec = info.get('codec')
-            if codec and codec in codecs:
-                codecs[codec] += 1
-
-    print(f"  Resolutions: {', '.join(sorted(resolutions)) if resolutions else 'none'}")
-    print(f"  Modes: {', '.join(f'0x{m:02X}' for m in sorted(modes)) if modes else 'none'}")
-    print(f"  Codecs: LZ={codecs['LZ']} AD={codecs['AD']} raw={codecs['raw']}")
-    print(f"  Sound frames: {sound_frames}")
-    print(f"  Palette updates: {palette_frames}")
+    print(f"  Resolutions: {', '.join(resolutions) if resolutions else 'none'}")
+    print(f"  Modes: {', '.join(f'0x{m:02X}' for m in modes) if modes else 'none'}")
+    print(f"  Codecs: LZ={codecs.get('LZ', 0)} AD={codecs.get('AD', 0)} raw={codecs.get('raw', 0)}")
+    print(f"  Sound frames: {summary['sound_frames']}")
+    print(f"  Palette updates: {summary['palette_frames']}")
 
     # Audio info
-    audio = hnm.extract_sound()
-    if audio:
-        duration = len(audio) / 11111.0
-        print(f"  Audio: {len(audio):,} bytes ({duration:.1f}s @ 11111 Hz)")
+    audio_size = hnm.sound_size()
+    if audio_size:
+        duration = audio_size / 11111.0
+        print(f"  Audio: {audio_size:,} bytes ({duration:.1f}s @ 11111 Hz)")
 
     # Video duration estimate
     if hnm.frame_count > 0:
         # Frame rate varies; audio-based estimate is more accurate
-        if audio:
+        if audio_size:
             fps = hnm.frame_count / duration if duration > 0 else 0
             print(f"  Est. FPS: {fps:.1f}")
         else:
@@ -875,7 +985,7 @@ def extract_frames(hnm: HnmFile, outdir: str, max_frames: int = 0):
             had_video = hnm.decode_frame(i, framebuf, palette)
             if had_video or i == 0:
                 bmp_path = os.path.join(outdir, f"frame_{i:04d}.bmp")
-                write_bmp(bmp_path, bytes(framebuf), bytes(palette))
+                write_bmp(bmp_path, framebuf, palette)
                 extracted += 1
         except Exception as e:
             errors += 1
@@ -899,6 +1009,72 @@ def show_palette(hnm: HnmFile):
                   f"#{r:02X}{g:02X}{b:02X}")
 
 
+# Files handed to each --stats worker task; amortises inter-process overhead
+STATS_CHUNKSIZE = 4
+
+
+def _stats_row(filepath: str):
+    """Parse one HNM file for --stats.
+
+    Returns a picklable summary tuple (fname, file_size, frame_count,
+    audio_bytes, resolutions, codecs), or None if the file does not exist.
+    Runs in a worker process.
+    """
+    if not os.path.exists(filepath):
+        return None
+    # Map the file instead of reading it: the index walk only touches the
+    # chunk and sub-chunk headers, so most of the video payload is never
+    # paged in. mmap cannot map an empty file.
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+    try:
+        hnm = HnmFile(data)
+
+        # Quick scan for resolution and codecs
+        summary = hnm.frame_summary(10)
+
+        return (os.path.basename(filepath), size, hnm.frame_count,
+                hnm.sound_size(),
+                sorted(f"{w}x{h}" for w, h in summary['resolutions']),
+                sorted(summary['codecs']))
+    finally:
+        if size:
+            data.close()
+
+
+# One --stats table row; a pre-bound str.format parses the template once
+_STATS_ROW = '{:<16} {:>10,}  {:>6}  {:>8}  {:<10}  {}'.format
+
+
+def show_stats(filepaths: list):
+    """Summary table for multiple HNM files.
+
+    Files are independent, so with more than one input the parse work is
+    spread over a ProcessPoolExecutor (in batches of STATS_CHUNKSIZE files
+    per task). Rows are printed in the order the files were given.
+    """
+    if len(filepaths) > 1:
+        with ProcessPoolExecutor() as ex:
+            rows = list(ex.map(_stats_row, filepaths, chunksize=STATS_CHUNKSIZE))
+    else:
+        rows = [_stats_row(fp) for fp in filepaths]
+
+    print(f"{'File':<16} {'Size':>10}  {'Frames':>6}  {'Audio':>8}  "
+          f"{'Resolution':<10}  {'Codecs'}")
+    print('-' * 72)
+
+    for row in rows:
+        if row is None:
+            continue
+        fname, file_size, frame_count, audio_bytes, res, codecs = row
+        audio_str = f"{audio_bytes / 1024:.0f}K" if audio_bytes else "-"
+        res_str = ', '.join(res) if res else "-"
+        codec_str = ', '.join(codecs) if codecs else "-"
+
+        print(_STATS_ROW(fname, file_size, frame_count, audio_str, res_str, codec_str))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Dune 1992 HNM Video File Decoder')
@@ -918,37 +1094,7 @@ def main():
     args = parser.parse_args()
 
     if args.stats:
-        print(f"{'File':<16} {'Size':>10}  {'Frames':>6}  {'Audio':>8}  "
-              f"{'Resolution':<10}  {'Codecs'}")
-        print('-' * 72)
-
-        for filepath in args.files:
-            if not os.path.exists(filepath):
-                continue
-            data = open(filepath, 'rb').read()
-            fname = os.path.basename(filepath)
-            hnm = HnmFile(data)
-
-            # Quick scan for resolution and codecs
-            res = set()
-            codec_set = set()
-            for i in range(min(hnm.frame_count, 10)):
-                info = hnm.get_frame_info(i)
-                if info and info.get('video'):
-                    w, h = info['width'], info['height']
-                    if w > 0 and h > 0:
-                        res.add(f"{w}x{h}")
-                    c = info.get('codec')
-                    if c:
-                        codec_set.add(c)
-
-            audio = hnm.extract_sound()
-            audio_str = f"{len(audio) / 1024:.0f}K" if audio else "-"
-            res_str = ', '.join(sorted(res)) if res else "-"
-            codec_str = ', '.join(sorted(codec_set)) if codec_set else "-"
-
-            print(f"{fname:<16} {len(data):>10,}  {hnm.frame_count:>6}  "
-                  f"{audio_str:>8}  {res_str:<10}  {codec_str}")
+        show_stats(args.files)
         return 0
 
     for filepath in args.files:
@@ -957,7 +1103,7 @@ def main():
             continue
 
         if args.extract or args.extract_sound or args.palette or args.frame_info is not None:
-            data = open(filepath, 'rb').read()
+            data = read_file(filepath)
             hnm = HnmFile(data)
 
             if args.palette:
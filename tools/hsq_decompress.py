@@ -17,7 +17,8 @@ import argparse
 import glob
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from lib.compression import hsq_decompress, hsq_get_sizes
+from lib.compression import hsq_decompress_into, hsq_get_sizes
+from lib.fileio import read_file
 
 
 def main():
@@ -33,9 +34,12 @@ def main():
         expanded = glob.glob(pattern)
         files.extend(expanded if expanded else [pattern])
 
+    # One output buffer for the whole batch; each file's result is written
+    # to disk straight from a view of it, with no intermediate bytes copy
+    out_buf = bytearray()
+
     for path in files:
-        with open(path, 'rb') as f:
-            raw = f.read()
+        raw = read_file(path)
 
         try:
             decomp_size, comp_size, checksum = hsq_get_sizes(raw)
@@ -48,7 +52,7 @@ def main():
             continue
 
         try:
-            data = hsq_decompress(raw)
+            data = hsq_decompress_into(raw, out_buf)
         except ValueError as e:
             print(f"  ERROR {path}: {e}")
             continue
@@ -64,6 +68,7 @@ def main():
 
         ratio = len(data) / len(raw) if len(raw) > 0 else 0
         print(f"  {path}: {len(raw):,} → {len(data):,} bytes ({ratio:.1f}x) → {out_path}")
+        data.release()  # out_buf is cleared and refilled by the next file
 
 
 if __name__ == '__main__':
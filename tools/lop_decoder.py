@@ -52,6 +52,10 @@ import argparse
 import os
 import struct
 import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+from fileio import read_file
 
 
 # =============================================================================
@@ -91,6 +95,11 @@ def parse_lop_header(data: bytes) -> dict:
     }
 
 
+# Section header (11 bytes): size, x, y, width, mode, flags, height,
+# reserved, data_size
+_SECTION_HEADER = struct.Struct('<HBBBBBBBH')
+
+
 def parse_section(data: bytes, file_header_size: int, sec_offset: int,
                   next_offset: int, file_size: int) -> dict:
     """Parse a single LOP section."""
@@ -106,15 +115,8 @@ def parse_section(data: bytes, file_header_size: int, sec_offset: int,
     if actual_size < 11:
         return {'error': f'Section too small ({actual_size} bytes)'}
 
-    stored_size = struct.unpack_from('<H', sec_data, 0)[0]
-    x_offset = sec_data[2]
-    y_offset = sec_data[3]
-    width = sec_data[4]
-    mode = sec_data[5]
-    flags = sec_data[6]
-    height = sec_data[7]
-    reserved = sec_data[8]
-    data_size = struct.unpack_from('<H', sec_data, 9)[0]
+    (stored_size, x_offset, y_offset, width, mode, flags, height,
+     reserved, data_size) = _SECTION_HEADER.unpack_from(sec_data, 0)
 
     compressed = (flags & 0x80) != 0
     pixel_data = sec_data[11:]
@@ -144,39 +146,72 @@ def decode_packbits(pixel_data: bytes, width: int, height: int, mode: int = 254)
     Returns bytearray of width*height palette indices.
     Mode 255 means color 0 is transparent (preserved as 0 in output).
     """
-    pixels = bytearray(width * height)
+    target = width * height
+    pixels = bytearray(target)
+    data_len = len(pixel_data)
     pos = 0
     out_pos = 0
-    target = width * height
 
-    while pos < len(pixel_data) and out_pos < target:
+    # One slice store per run rather than one per pixel; runs that would
+    # overshoot the output or the input are clipped the same way.
+    while pos < data_len and out_pos < target:
         cmd = pixel_data[pos]
         pos += 1
 
         if cmd & 0x80:
             # RLE: repeat next byte (257 - cmd) times
-            count = 257 - cmd
-            if pos >= len(pixel_data):
+            if pos >= data_len:
                 break
-            val = pixel_data[pos]
+            count = min(257 - cmd, target - out_pos)
+            pixels[out_pos:out_pos + count] = bytes((pixel_data[pos],)) * count
             pos += 1
-            for _ in range(count):
-                if out_pos < target:
-                    pixels[out_pos] = val
-                    out_pos += 1
         else:
             # Literal: copy (cmd + 1) bytes
-            count = cmd + 1
-            for _ in range(count):
-                if pos >= len(pixel_data) or out_pos >= target:
-                    break
-                pixels[out_pos] = pixel_data[pos]
-                out_pos += 1
-                pos += 1
+            count = min(cmd + 1, data_len - pos, target - out_pos)
+            pixels[out_pos:out_pos + count] = pixel_data[pos:pos + count]
+            pos += count
+        out_pos += count
 
     return pixels
 
 
+def packbits_histogram(pixel_data: bytes, width: int, height: int) -> Counter:
+    """Colour histogram of PackBits data, without decoding it.
+
+    Walks the same control stream as decode_packbits() (with the same
+    clipping) and tallies runs directly: an RLE run adds its length to one
+    colour, a literal run is counted from the input slice. Pixels past the
+    end of the stream count as colour 0, as in the decoded buffer. Keys
+    are in order of first appearance in the decoded image.
+    """
+    target = width * height
+    hist = Counter()
+    update = hist.update
+    data_len = len(pixel_data)
+    pos = 0
+    out_pos = 0
+
+    while pos < data_len and out_pos < target:
+        cmd = pixel_data[pos]
+        pos += 1
+
+        if cmd & 0x80:
+            if pos >= data_len:
+                break
+            count = min(257 - cmd, target - out_pos)
+            hist[pixel_data[pos]] += count
+            pos += 1
+        else:
+            count = min(cmd + 1, data_len - pos, target - out_pos)
+            update(pixel_data[pos:pos + count])
+            pos += count
+        out_pos += count
+
+    if out_pos < target:
+        hist[0] += target - out_pos
+    return hist
+
+
 def decode_section_pixels(section: dict) -> bytearray:
     """Decode a section's pixel data using PackBits compression."""
     return decode_packbits(
@@ -222,12 +257,13 @@ def show_file(filepath: str, data: bytes, verbose: bool = False):
         print(f"    Comp. ratio: {ratio:.2f}")
 
         if verbose:
-            # Try to decode and show stats
-            pixels = decode_section_pixels(sec)
-            decoded_count = sum(1 for p in pixels if p != 0)
-            unique_colors = len(set(pixels))
-            print(f"    Decoded:     {len(pixels):,} pixels, {unique_colors} unique colors")
-            print(f"    Non-zero:    {decoded_count:,} pixels ({decoded_count*100//len(pixels)}%)")
+            # Pixel stats straight from the PackBits runs
+            hist = packbits_histogram(sec['pixel_data'], sec['width'], sec['height'])
+            n_pixels = sec['pixel_area']
+            decoded_count = n_pixels - hist[0]
+            unique_colors = len(hist)
+            print(f"    Decoded:     {n_pixels:,} pixels, {unique_colors} unique colors")
+            print(f"    Non-zero:    {decoded_count:,} pixels ({decoded_count*100//n_pixels}%)")
 
 
 def show_section(filepath: str, data: bytes, sec_idx: int):
@@ -253,35 +289,40 @@ def show_section(filepath: str, data: bytes, sec_idx: int):
         hex_str = ' '.join(f'{raw[j]:02X}' for j in range(i, min(i + 16, len(raw))))
         print(f"    {i:04X}: {hex_str}")
 
-    # Decode and analyze compression
-    pixels = decode_section_pixels(sec)
-    unique_colors = sorted(set(pixels))
-    non_zero = sum(1 for p in pixels if p != 0)
+    # Analyze the decoded image from the PackBits runs, without decoding
+    # it. Histogram keys keep first-appearance order, which the stable
+    # top-10 sort below relies on for ties.
+    hist = packbits_histogram(sec['pixel_data'], sec['width'], sec['height'])
+    n_pixels = sec['pixel_area']
+    unique_colors = sorted(hist)
+    non_zero = n_pixels - hist[0]
 
-    print(f"\n  Decoded pixels: {len(pixels):,}")
-    print(f"  Non-zero:       {non_zero:,} ({non_zero*100//max(1,len(pixels))}%)")
+    print(f"\n  Decoded pixels: {n_pixels:,}")
+    print(f"  Non-zero:       {non_zero:,} ({non_zero*100//max(1,n_pixels)}%)")
     print(f"  Unique colors:  {len(unique_colors)}")
     if len(unique_colors) <= 32:
         print(f"  Color values:   {', '.join(f'0x{c:02X}' for c in unique_colors)}")
 
     # Show color histogram (top 10)
-    hist = {}
-    for p in pixels:
-        hist[p] = hist.get(p, 0) + 1
     print(f"\n  Top 10 colors:")
     for val, count in sorted(hist.items(), key=lambda x: -x[1])[:10]:
-        pct = count * 100 / len(pixels)
+        pct = count * 100 / n_pixels
         bar = '#' * min(30, int(pct))
         print(f"    0x{val:02X}: {count:6d} ({pct:5.1f}%) {bar}")
 
 
+# One --stats table row: file, size, blit rectangle, per-section sizes.
+# A pre-bound str.format parses the template once, not on every row.
+_STATS_ROW = ('{:<14} {:>8,}  {:>11}  ' + '  '.join(['{:6,}'] * SECTION_COUNT)).format
+
+
 def show_stats(filepaths: list):
     """Show summary statistics for multiple LOP files."""
     print(f"{'File':<14} {'Size':>8}  {'Blit':>11}  {'Sec0':>6}  {'Sec1':>6}  {'Sec2':>6}  {'Sec3':>6}")
     print('-' * 70)
 
     for filepath in filepaths:
-        data = open(filepath, 'rb').read()
+        data = read_file(filepath)
         fname = os.path.basename(filepath)
         header = parse_lop_header(data)
 
@@ -298,8 +339,7 @@ def show_stats(filepaths: list):
             else:
                 sizes.append(0)
 
-        size_strs = [f'{s:6,}' for s in sizes]
-        print(f"{fname:<14} {len(data):>8,}  {blit:>11}  {'  '.join(size_strs)}")
+        print(_STATS_ROW(fname, len(data), blit, *sizes))
 
 
 def export_section_ppm(sec: dict, pixels: bytearray, outpath: str):
@@ -308,11 +348,14 @@ def export_section_ppm(sec: dict, pixels: bytearray, outpath: str):
     if w == 0 or h == 0:
         return False
 
+    # Greyscale — actual palette mapping would need the scene palette.
+    # Expand each index to an (i, i, i) triplet with three strided stores.
+    rgb = bytearray(len(pixels) * 3)
+    rgb[0::3] = rgb[1::3] = rgb[2::3] = pixels
+
     with open(outpath, 'wb') as f:
         f.write(f'P6\n{w} {h}\n255\n'.encode())
-        for p in pixels:
-            # Greyscale — actual palette mapping would need the scene palette
-            f.write(bytes([p, p, p]))
+        f.write(rgb)
     return True
 
 
@@ -369,7 +412,7 @@ def main():
             print(f"File not found: {filepath}", file=sys.stderr)
             continue
 
-        data = open(filepath, 'rb').read()
+        data = read_file(filepath)
 
         if args.section is not None:
             if args.section < 0 or args.section >= SECTION_COUNT:
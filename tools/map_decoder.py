@@ -24,14 +24,30 @@ Related resources:
 
 import argparse
 import os
+import re
 import struct
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 from compression import hsq_decompress
+from fileio import read_file
 
 RES_MAP_SIZE = 0x0C5F9  # 50681 bytes
 
+# A byte followed by at least 7 copies of itself
+_LONG_RUN = re.compile(rb'(.)\1{7,}', re.DOTALL)
+
+
+def byte_histogram(data) -> dict:
+    """Count each byte value present in data.
+
+    Keys are in order of first appearance. The map only uses a few dozen
+    distinct values, so one C-level count() per value present is cheaper
+    than tallying 50K bytes in a Python loop.
+    """
+    values = sorted(set(data), key=data.index)
+    return {v: data.count(v) for v in values}
+
 
 def analyze_map(data):
     """Analyze MAP data structure and contents."""
@@ -39,34 +55,24 @@ def analyze_map(data):
     print(f"MAP data: {size} bytes (expected {RES_MAP_SIZE})")
 
     # Value distribution
-    hist = [0] * 256
-    for b in data:
-        hist[b] += 1
+    hist = byte_histogram(data)
+    unique = sorted(hist)
 
     print(f"\nByte value distribution:")
     print(f"  {'Value':>5}  {'Count':>6}  {'Pct':>5}  Bar")
     print(f"  {'-'*5}  {'-'*6}  {'-'*5}  {'-'*40}")
-    for v in range(256):
-        if hist[v] > 0:
-            pct = hist[v] * 100.0 / size
-            bar = '#' * min(40, int(pct))
-            print(f"  0x{v:02X}  {hist[v]:6d}  {pct:4.1f}%  {bar}")
+    for v in unique:
+        pct = hist[v] * 100.0 / size
+        bar = '#' * min(40, int(pct))
+        print(f"  0x{v:02X}  {hist[v]:6d}  {pct:4.1f}%  {bar}")
 
     # Unique values
-    unique = sorted(set(data))
     print(f"\nUnique values ({len(unique)}): {', '.join(f'0x{v:02X}' for v in unique)}")
 
-    # Run analysis
-    runs = []
-    i = 0
-    while i < size:
-        run_val = data[i]
-        run_len = 1
-        while i + run_len < size and data[i + run_len] == run_val:
-            run_len += 1
-        if run_len >= 8:
-            runs.append((i, run_len, run_val))
-        i += run_len
+    # Run analysis: the regex matches each maximal run of 8+ identical
+    # bytes, scanning in C
+    runs = [(m.start(), m.end() - m.start(), data[m.start()])
+            for m in _LONG_RUN.finditer(data)]
 
     print(f"\nLong runs (≥8 identical bytes): {len(runs)}")
     if runs:
@@ -87,10 +93,23 @@ def dump_map_region(data, offset, size=256):
         print(f"  {i:05X}: {hex_str:<48s}  {ascii_str}")
 
 
+def _terrain_table() -> bytes:
+    """Byte value → render character: upper class bounds 0, 4, 8, 0x10, 0x20, 0x30, 0x40."""
+    table = bytearray(b'#' * 256)
+    lo = 0
+    for hi, c in ((0, b' '), (4, b'.'), (8, b':'), (0x10, b'-'),
+                  (0x20, b'='), (0x30, b'+'), (0x40, b'*')):
+        table[lo:hi + 1] = c * (hi + 1 - lo)
+        lo = hi + 1
+    return bytes(table)
+
+
+_TERRAIN_CHARS = _terrain_table()
+
+
 def render_map_ascii(data, width=200, height=100):
     """Render map data as ASCII art using terrain value mapping."""
     size = len(data)
-    chars = ' .:-=+*#%@'
 
     # Determine dimensions: try common widths
     # The map is accessed linearly, so we try various row widths
@@ -107,31 +126,11 @@ def render_map_ascii(data, width=200, height=100):
     x_step = max(1, best_width // width)
     y_step = max(1, actual_height // height)
 
+    # Every x_step-th byte of a row is a strided slice; the terrain
+    # classes are a 256-entry translate() table
     for y in range(0, actual_height, y_step):
-        line = []
-        for x in range(0, best_width, x_step):
-            idx = y * best_width + x
-            if idx < size:
-                val = data[idx]
-                # Map terrain values to characters
-                if val == 0:
-                    c = ' '
-                elif val <= 4:
-                    c = '.'
-                elif val <= 8:
-                    c = ':'
-                elif val <= 0x10:
-                    c = '-'
-                elif val <= 0x20:
-                    c = '='
-                elif val <= 0x30:
-                    c = '+'
-                elif val <= 0x40:
-                    c = '*'
-                else:
-                    c = '#'
-                line.append(c)
-        print(''.join(line))
+        row = data[y * best_width:(y + 1) * best_width:x_step]
+        print(row.translate(_TERRAIN_CHARS).decode('ascii'))
 
 
 def main():
@@ -151,7 +150,7 @@ def main():
                         help='ASCII render height (default: 60)')
     args = parser.parse_args()
 
-    raw = open(args.file, 'rb').read()
+    raw = read_file(args.file)
     if args.raw:
         data = raw
     else:
@@ -175,10 +174,8 @@ def main():
         return 0
 
     # Default: brief summary
-    unique = len(set(data))
-    hist = {}
-    for b in data:
-        hist[b] = hist.get(b, 0) + 1
+    hist = byte_histogram(data)
+    unique = len(hist)
     top3 = sorted(hist.items(), key=lambda x: -x[1])[:3]
     print(f"MAP.HSQ: {len(data)} bytes, {unique} unique values")
     print(f"  Most common: {', '.join(f'0x{v:02X} ({c} times, {c*100//len(data)}%)' for v,c in top3)}")
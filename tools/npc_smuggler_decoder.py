@@ -28,9 +28,11 @@ import struct
 import sys
 import argparse
 import os
+from operator import itemgetter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.compression import f7_decompress
+from lib.fileio import read_file
 from lib.constants import (
     SAVE_OFFSETS, NPC_COUNT, NPC_STRIDE, NPC_SIZE,
     NPC_FIELDS, NPC_SPRITES,
@@ -45,8 +47,7 @@ from lib.constants import (
 
 def load_save(path: str) -> bytes:
     """Load and decompress a DUNE*.SAV file."""
-    with open(path, 'rb') as f:
-        raw = f.read()
+    raw = read_file(path)
     return bytes(f7_decompress(raw))
 
 
@@ -54,14 +55,20 @@ def load_save(path: str) -> bytes:
 # NPC DECODER
 # =============================================================================
 
+# Record layouts as (field names, one C-level getter for all field bytes,
+# bytes spanned by the fields), so a record decodes without a Python loop
+_NPC_NAMES = tuple(name for name, _type, _desc in NPC_FIELDS.values())
+_NPC_GET = itemgetter(*NPC_FIELDS)
+_NPC_SPAN = max(NPC_FIELDS) + 1
+
 def decode_npc(data: bytes, index: int) -> dict:
     """Decode a single NPC record from save data."""
     base = SAVE_OFFSETS["npc_data"] + index * NPC_STRIDE
     record = data[base:base + NPC_SIZE]
 
     npc = {"index": index, "offset": base}
-    for field_off, (name, _type, _desc) in NPC_FIELDS.items():
-        npc[name] = record[field_off] if field_off < len(record) else 0
+    # A truncated record reads its missing fields as 0
+    npc.update(zip(_NPC_NAMES, _NPC_GET(record.ljust(_NPC_SPAN, b'\x00'))))
 
     # Resolve character name from FieldB (character index)
     # SpriteId (byte 0) is always 0x00 in saves — runtime-initialized
@@ -85,14 +92,18 @@ def decode_all_npcs(data: bytes) -> list:
 # SMUGGLER DECODER
 # =============================================================================
 
+_SMUGGLER_NAMES = tuple(name for name, _type, _desc in SMUGGLER_FIELDS.values())
+_SMUGGLER_GET = itemgetter(*SMUGGLER_FIELDS)
+_SMUGGLER_SPAN = max(SMUGGLER_FIELDS) + 1
+
 def decode_smuggler(data: bytes, index: int) -> dict:
     """Decode a single Smuggler record from save data."""
     base = SAVE_OFFSETS["smuggler_data"] + index * SMUGGLER_STRIDE
     record = data[base:base + SMUGGLER_SIZE]
 
     smug = {"index": index, "offset": base}
-    for field_off, (name, _type, _desc) in SMUGGLER_FIELDS.items():
-        smug[name] = record[field_off] if field_off < len(record) else 0
+    # A truncated record reads its missing fields as 0
+    smug.update(zip(_SMUGGLER_NAMES, _SMUGGLER_GET(record.ljust(_SMUGGLER_SPAN, b'\x00'))))
 
     smug["raw"] = record
     smug["padding"] = data[base + SMUGGLER_SIZE:base + SMUGGLER_STRIDE]
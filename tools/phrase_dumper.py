@@ -37,6 +37,7 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.compression import hsq_decompress
+from lib.fileio import read_file
 
 
 # =============================================================================
@@ -60,8 +61,7 @@ def load_phrase(path: str, is_raw: bool = False) -> tuple:
 
     Returns: (data_bytes, string_count, offsets_list)
     """
-    with open(path, 'rb') as f:
-        raw = f.read()
+    raw = read_file(path)
 
     if not is_raw:
         try:
@@ -79,15 +79,18 @@ def load_phrase(path: str, is_raw: bool = False) -> tuple:
     first_offset = struct.unpack_from('<H', data, 0)[0]
     string_count = first_offset // 2
 
-    offsets = []
-    for i in range(string_count):
-        if i * 2 + 1 >= len(data):
-            break
-        offsets.append(struct.unpack_from('<H', data, i * 2)[0])
+    # One unpack for the whole table, clipped to the words actually present
+    n_offsets = min(string_count, len(data) // 2)
+    offsets = list(struct.unpack_from(f'<{n_offsets}H', data, 0))
 
     return bytes(data), string_count, offsets
 
 
+# Rendering of non-text bytes: 0xFF separators and control codes
+_TEXT_ESCAPES = {b: f'\\x{b:02X}' for b in range(0x20)}
+_TEXT_ESCAPES[0xFF] = ' | '
+
+
 def get_string_between(data: bytes, start: int, end: int) -> str:
     """
     Extract a string between two offsets.
@@ -103,19 +106,12 @@ def get_string_between(data: bytes, start: int, end: int) -> str:
 
     raw_bytes = data[start:min(end, len(data))]
 
-    # Strip trailing 0xFF separator
-    while raw_bytes and raw_bytes[-1] == 0xFF:
-        raw_bytes = raw_bytes[:-1]
+    # Strip trailing 0xFF separator (one C-level scan, no per-byte reslice)
+    raw_bytes = raw_bytes.rstrip(b'\xFF')
 
-    text = ''
-    for b in raw_bytes:
-        if b == 0xFF:
-            text += ' | '
-        elif b >= 0x20:
-            text += chr(b)
-        else:
-            text += f'\\x{b:02X}'
-    return text
+    # Latin-1 maps each byte to the same code point; the translate table
+    # then rewrites separators and control bytes in one C-level pass
+    return raw_bytes.decode('latin-1').translate(_TEXT_ESCAPES)
 
 
 def get_raw_between(data: bytes, start: int, end: int) -> bytes:
@@ -217,6 +213,7 @@ def show_stats(data: bytes, offsets: list, filename: str):
 
     total_len = 0
     sep_count = 0
+    strings_with_sep = 0
     lengths = []
     sep_marker = b'\xFF'
 
@@ -225,12 +222,10 @@ def show_stats(data: bytes, offsets: list, filename: str):
         raw = get_raw_between(data, offsets[i], end)
         total_len += len(raw)
         lengths.append(len(raw))
-        sep_count += raw.count(sep_marker)
-
-    strings_with_sep = sum(
-        1 for i in range(len(offsets))
-        if sep_marker in get_raw_between(data, offsets[i], string_end(offsets, i, len(data)))
-    )
+        seps = raw.count(sep_marker)
+        sep_count += seps
+        if seps:
+            strings_with_sep += 1
 
     print(f"=== PHRASE Statistics ===")
     print(f"  File:             {os.path.basename(filename)}")
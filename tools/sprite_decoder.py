@@ -190,20 +190,34 @@ def decode_sprite(data, sprite_idx):
     }
 
 
-def sprite_to_ppm(sprite, palette, outpath):
-    """Write sprite as PPM image file."""
+def palette_rgb_table(palette):
+    """Build an index → RGB bytes table for sprite_to_ppm().
+
+    Covers every index a sprite pixel can take (palette offset plus a 4-bit
+    nibble, so up to 0xFF + 0x0F) and every palette entry; indices missing
+    from the palette map to black. Built once per palette and shared by all
+    sprites that use it.
+    """
+    size = max(0xFF + 0x0F, max(palette, default=0)) + 1
+    table = [b'\x00\x00\x00'] * size  # unmapped → black
+    for idx, rgb in palette.items():
+        table[idx] = bytes(rgb)
+    return table
+
+
+def sprite_to_ppm(sprite, rgb_table, outpath):
+    """Write sprite as PPM image file.
+
+    rgb_table comes from palette_rgb_table(); each pixel is a single table
+    lookup, and the image body goes out in one write.
+    """
     w, h = sprite['width'], sprite['height']
     if w == 0 or h == 0:
         return False
 
     with open(outpath, 'wb') as f:
         f.write(f'P6\n{w} {h}\n255\n'.encode())
-        for idx in sprite['pixels']:
-            if idx in palette:
-                r, g, b = palette[idx]
-            else:
-                r = g = b = 0  # unmapped → black
-            f.write(bytes([r, g, b]))
+        f.write(b''.join(map(rgb_table.__getitem__, sprite['pixels'])))
     return True
 
 
@@ -301,12 +315,13 @@ def main():
 
     if args.export:
         os.makedirs(args.export, exist_ok=True)
+        rgb_table = palette_rgb_table(palette)
         exported = 0
         for i in range(n_sprites):
             try:
                 spr = decode_sprite(data, i)
                 outpath = os.path.join(args.export, f'{basename}_{i:03d}.ppm')
-                if sprite_to_ppm(spr, palette, outpath):
+                if sprite_to_ppm(spr, rgb_table, outpath):
                     exported += 1
             except Exception as e:
                 print(f"  Sprite {i}: error: {e}", file=sys.stderr)